@@ -33,6 +33,9 @@ class Settings:
     DEFAULT_LIBRARY_ID: Final[str] = "default"
     DEFAULT_LIBRARY_NAME: Final[str] = "默认"
 
+    # Time sync settings (cached internet time offset)
+    TIME_OFFSET_FILE: Final[Path] = DATA_DIR / "time_offset.json"
+
     # TOTP settings
     TOTP_PERIOD: Final[int] = 30
     TOTP_DIGITS: Final[int] = 6
@@ -7,11 +7,14 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """
     Represents a Google account with 2FA credentials.
 
+    Uses __slots__: libraries hold thousands of accounts, and slots keep
+    each instance small and its field access fast in the table model.
+
     Attributes:
         email: The account email address.
         password: The account password.
@@ -31,10 +34,41 @@ class Account:
     groups: list[str] = field(default_factory=list)
     notes: str = ""
 
+    # Cache for email_normalized: (source email, normalized email)
+    _email_cache: tuple[str, str] = field(
+        default=("", ""), init=False, repr=False, compare=False
+    )
+    # Cache for search_text: (source fields, searchable text)
+    _search_cache: tuple[tuple, str] = field(
+        default=((), ""), init=False, repr=False, compare=False
+    )
+
     @property
     def email_normalized(self) -> str:
         """Get normalized email for comparison (lowercase, stripped)."""
-        return self.email.lower().strip()
+        # Normalized once per email value; recomputed only if email is reassigned
+        source, normalized = self._email_cache
+        if source is not self.email:
+            normalized = self.email.lower().strip()
+            self._email_cache = (self.email, normalized)
+        return normalized
+
+    @property
+    def search_text(self) -> str:
+        """
+        Get the searchable fields (email, password, backup, secret, notes,
+        groups) lowercased and joined with NUL, so a search term matches a
+        field with a single substring test.
+        """
+        # Lowercased once per field values; rebuilt only if a field changes.
+        # Optional fields may be None (e.g. a cleared note), so they join as "".
+        source = (self.email, self.password or "", self.backup or "",
+                  self.secret or "", self.notes or "", *self.groups)
+        cached_source, text = self._search_cache
+        if source != cached_source:
+            text = "\0".join(source).lower()
+            self._search_cache = (source, text)
+        return text
 
     @property
     def has_2fa(self) -> bool:
@@ -80,7 +80,8 @@ class AppState:
 
     def is_duplicate_email(self, email: str) -> bool:
         """Check if an email already exists in accounts."""
-        return email.lower().strip() in self.existing_emails
+        normalized = email.lower().strip()
+        return any(acc.email_normalized == normalized for acc in self.accounts)
 
     def generate_next_id(self) -> int:
         """Generate and return the next unique account ID."""
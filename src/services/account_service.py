@@ -209,12 +209,17 @@ class AccountService(QObject):
         Returns:
             List of tuples (new_account, existing_account, existing_index).
         """
+        # Index existing accounts by email once (first occurrence wins)
+        existing_by_email: dict[str, tuple[int, Account]] = {}
+        for i, existing in enumerate(self.state.accounts):
+            existing_by_email.setdefault(existing.email_normalized, (i, existing))
+
         duplicates = []
         for new_acc in accounts:
-            for i, existing in enumerate(self.state.accounts):
-                if new_acc.email_normalized == existing.email_normalized:
-                    duplicates.append((new_acc, existing, i))
-                    break
+            match = existing_by_email.get(new_acc.email_normalized)
+            if match is not None:
+                i, existing = match
+                duplicates.append((new_acc, existing, i))
         return duplicates
 
     def clear_all(self, move_to_trash: bool = True) -> int:
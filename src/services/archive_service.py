@@ -13,6 +13,7 @@ from typing import Optional
 from ..config.settings import Settings
 from ..models.app_state import AppState
 from ..utils.exceptions import ArchiveError
+from ..utils.json_io import load_json, save_json
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -82,9 +83,8 @@ class ArchiveService:
             return []
 
         try:
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('archives', [])
+            data = load_json(self.index_file)
+            return data.get('archives', [])
         except Exception as e:
             logger.warning(f"Failed to load archive index: {e}")
             return []
@@ -93,8 +93,7 @@ class ArchiveService:
         """Save archive index to file."""
         self._ensure_dir()
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump({'archives': archives}, f, ensure_ascii=False, indent=2)
+            save_json(self.index_file, {'archives': archives})
         except Exception as e:
             logger.error(f"Failed to save archive index: {e}")
             raise ArchiveError("Failed to save archive index", e)
@@ -122,8 +121,7 @@ class ArchiveService:
         try:
             # Save state to archive file
             data = state.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            save_json(file_path, data)
 
             # Create archive info
             archive_info = ArchiveInfo(
@@ -188,8 +186,7 @@ class ArchiveService:
             raise ArchiveError(f"Archive file not found: {archive_info.filename}")
 
         try:
-            with open(archive_info.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(archive_info.file_path)
 
             state = AppState.from_dict(data)
             logger.info(f"Restored archive: {archive_info.filename}")
@@ -2,6 +2,8 @@
 Backup service for creating and managing data backups.
 """
 
+import hashlib
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +15,10 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sidecar holding the content digest of a backup, e.g. "<backup>.json.sha"
+DIGEST_SUFFIX = ".sha"
+HASH_CHUNK_SIZE = 64 * 1024
+
 
 class BackupService:
     """
@@ -37,12 +43,30 @@ class BackupService:
         self.backup_dir = backup_dir or Settings.BACKUP_DIR
         self.max_backups = max_backups
 
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Get the content digest of a file, read in chunks."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _digest_path(backup_path: Path) -> Path:
+        """Get the digest sidecar path of a backup file."""
+        return backup_path.with_name(backup_path.name + DIGEST_SUFFIX)
+
     def create_backup(self) -> Optional[Path]:
         """
         Create a backup of the data file.
 
+        The copy is skipped when the data file is unchanged since the
+        latest backup, in which case that backup is returned.
+
         Returns:
-            Path to the created backup file, or None if source doesn't exist.
+            Path to the created (or unchanged latest) backup file, or None
+            if source doesn't exist.
 
         Raises:
             BackupError: If the backup operation fails.
@@ -55,6 +79,18 @@ class BackupService:
             # Ensure backup directory exists
             self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+            # Skip the copy if the latest backup already holds this content
+            digest = self._file_digest(self.data_file)
+            latest = self.get_latest_backup()
+            if latest is not None:
+                try:
+                    latest_digest = self._digest_path(latest).read_text(encoding='utf-8').strip()
+                except OSError:
+                    latest_digest = None
+                if latest_digest == digest:
+                    logger.debug(f"Data unchanged since {latest.name}, skipping backup")
+                    return latest
+
             # Create backup filename with timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_filename = f"{Settings.BACKUP_PREFIX}{timestamp}{Settings.BACKUP_SUFFIX}"
@@ -62,6 +98,7 @@ class BackupService:
 
             # Copy data file to backup
             shutil.copy2(self.data_file, backup_path)
+            self._digest_path(backup_path).write_text(digest, encoding='utf-8')
 
             # Clean up old backups
             self.cleanup_old_backups()
@@ -84,16 +121,13 @@ class BackupService:
             return 0
 
         try:
-            # Get all backup files, sorted by name (which includes timestamp)
-            backups = sorted([
-                f for f in self.backup_dir.iterdir()
-                if f.name.startswith(Settings.BACKUP_PREFIX) and f.name.endswith(Settings.BACKUP_SUFFIX)
-            ], key=lambda f: f.name, reverse=True)
+            backups = self.list_backups()
 
-            # Remove old backups beyond the limit
+            # Remove old backups (and their digests) beyond the limit
             removed = 0
             for old_backup in backups[self.max_backups:]:
                 old_backup.unlink()
+                self._digest_path(old_backup).unlink(missing_ok=True)
                 removed += 1
                 logger.debug(f"Removed old backup: {old_backup.name}")
 
@@ -116,12 +150,17 @@ class BackupService:
         if not self.backup_dir.exists():
             return []
 
-        backups = sorted([
-            f for f in self.backup_dir.iterdir()
-            if f.name.startswith(Settings.BACKUP_PREFIX) and f.name.endswith(Settings.BACKUP_SUFFIX)
-        ], key=lambda f: f.name, reverse=True)
-
-        return backups
+        # Sorted by name (which includes the timestamp); mtime is not usable
+        # since copy2() keeps the data file's mtime
+        with os.scandir(self.backup_dir) as entries:
+            names = sorted((
+                entry.name for entry in entries
+                if entry.name.startswith(Settings.BACKUP_PREFIX)
+                and entry.name.endswith(Settings.BACKUP_SUFFIX)
+                and entry.is_file()
+            ), reverse=True)
+
+        return [self.backup_dir / name for name in names]
 
     def get_latest_backup(self) -> Optional[Path]:
         """
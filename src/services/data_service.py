@@ -9,6 +9,7 @@ from typing import Optional
 from ..config.settings import Settings
 from ..models.app_state import AppState
 from ..utils.exceptions import DataLoadError, DataSaveError
+from ..utils.json_io import load_json, save_json
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -43,8 +44,7 @@ class DataService:
             return AppState()
 
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(self.data_file)
 
             state = AppState.from_dict(data)
             logger.info(f"Loaded {len(state.accounts)} accounts from {self.data_file}")
@@ -73,8 +73,7 @@ class DataService:
 
             data = state.to_dict()
 
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            save_json(self.data_file, data)
 
             logger.info(f"Saved {len(state.accounts)} accounts to {self.data_file}")
 
@@ -2,8 +2,10 @@
 Import service for parsing and importing account data.
 """
 
+import re
 from datetime import datetime
-from typing import Optional
+from itertools import chain
+from typing import Iterable, Optional
 
 from ..models.account import Account
 from ..utils.logger import get_logger
@@ -27,6 +29,13 @@ class ImportService:
         ',',     # comma
     ]
 
+    # One alternation over all separators (longest first), so each sample line
+    # is scanned once instead of once per candidate separator.
+    SEPARATOR_PATTERN = re.compile('|'.join(re.escape(sep) for sep in SEPARATORS))
+
+    # Number of non-empty lines sampled for separator detection
+    SAMPLE_LINES = 5
+
     def detect_separator(self, lines: list[str]) -> str:
         """
         Auto-detect the separator used in the data.
@@ -45,33 +54,31 @@ class ImportService:
         for line in lines:
             if line.strip():
                 sample_lines.append(line)
-                if len(sample_lines) >= 5:
+                if len(sample_lines) >= self.SAMPLE_LINES:
                     break
 
         if not sample_lines:
             return '----'  # Default
 
+        # Collect the separator tokens present in each line in a single scan
+        line_tokens = [set(self.SEPARATOR_PATTERN.findall(line)) for line in sample_lines]
+
         # Try each separator in priority order
         for sep in self.SEPARATORS:
-            matches = 0
-            for line in sample_lines:
-                parts = line.split(sep)
-                # A valid separator should give us at least 2 parts
-                if len(parts) >= 2:
-                    # Check that parts have reasonable content
-                    if all(p.strip() or True for p in parts[:2]):
-                        matches += 1
+            # A line matches if the separator occurs in it (e.g. '----' also holds '---')
+            matches = sum(1 for tokens in line_tokens if any(sep in tok for tok in tokens))
 
             # If most lines match, use this separator
             if matches >= len(sample_lines) * 0.6:
-                logger.info(f"Detected separator: {repr(sep)}")
+                logger.debug(f"Detected separator: {repr(sep)}")
                 return sep
 
         # Default to 4 dashes
-        logger.info("Using default separator: ----")
+        logger.debug("Using default separator: ----")
         return '----'
 
-    def parse_line(self, line: str, separator: Optional[str] = None) -> Optional[Account]:
+    def parse_line(self, line: str, separator: Optional[str] = None,
+                   import_time: Optional[str] = None) -> Optional[Account]:
         """
         Parse a single line into an Account object.
 
@@ -80,6 +87,7 @@ class ImportService:
         Args:
             line: The line to parse.
             separator: The separator to use. If None, auto-detects.
+            import_time: Import timestamp to record. If None, the current time.
 
         Returns:
             Account object, or None if line is empty/invalid.
@@ -92,23 +100,23 @@ class ImportService:
         if separator is None:
             separator = self.detect_separator([line])
 
-        parts = line.split(separator)
+        # Only the first four fields are used; maxsplit=4 keeps trailing extra
+        # fields out of the secret without splitting the rest of the line
+        parts = [p.strip() for p in line.split(separator, 4)[:4]]
 
         # Need at least an email
-        if not parts or not parts[0].strip():
+        if not parts[0]:
             return None
 
-        email = parts[0].strip()
-        password = parts[1].strip() if len(parts) > 1 else ""
-        backup = parts[2].strip() if len(parts) > 2 else ""
-        secret = parts[3].strip() if len(parts) > 3 else ""
+        parts += [""] * (4 - len(parts))
+        email, password, backup, secret = parts
 
         return Account(
             email=email,
             password=password,
             backup=backup,
             secret=secret,
-            import_time=datetime.now().strftime("%Y-%m-%d %H:%M")
+            import_time=import_time or datetime.now().strftime("%Y-%m-%d %H:%M")
         )
 
     def parse_text(self, text: str, separator: Optional[str] = None) -> list[Account]:
@@ -122,28 +130,58 @@ class ImportService:
         Returns:
             List of Account objects.
         """
-        lines = text.strip().split('\n')
+        # splitlines() handles \r\n / \r without a strip() copy of the whole text;
+        # blank lines are skipped by parse_line()
+        accounts = self.parse_lines(text.splitlines(), separator)
+        logger.debug(f"Parsed {len(accounts)} accounts from text")
+        return accounts
+
+    def parse_lines(self, lines: Iterable[str], separator: Optional[str] = None) -> list[Account]:
+        """
+        Parse lines into a list of accounts.
 
-        if not lines:
-            return []
+        The lines are consumed in a single pass, so an open file can be
+        passed directly; only the lines needed to detect the separator are
+        buffered ahead of parsing.
 
-        # Auto-detect separator from all lines if not provided
+        Args:
+            lines: Lines to parse (a list, file object or other iterable).
+            separator: The separator to use. If None, auto-detects.
+
+        Returns:
+            List of Account objects.
+        """
+        lines = iter(lines)
+
+        # Auto-detect separator from the leading lines if not provided
         if separator is None:
-            separator = self.detect_separator(lines)
+            head = []
+            sampled = 0
+            for line in lines:
+                head.append(line)
+                if line.strip():
+                    sampled += 1
+                    if sampled >= self.SAMPLE_LINES:
+                        break
+            separator = self.detect_separator(head)
+            lines = chain(head, lines)
+
+        # One timestamp for the whole batch instead of a strftime() per line
+        import_time = datetime.now().strftime("%Y-%m-%d %H:%M")
 
         accounts = []
         for line in lines:
-            account = self.parse_line(line, separator)
+            account = self.parse_line(line, separator, import_time)
             if account:
                 accounts.append(account)
-
-        logger.info(f"Parsed {len(accounts)} accounts from text")
         return accounts
 
     def parse_file(self, file_path: str, separator: Optional[str] = None) -> list[Account]:
         """
         Parse a file into a list of accounts.
 
+        The file is read line by line rather than loaded whole.
+
         Args:
             file_path: Path to the file.
             separator: The separator to use. If None, auto-detects.
@@ -156,9 +194,8 @@ class ImportService:
             IOError: If the file cannot be read.
         """
         with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+            accounts = self.parse_lines(f, separator)
 
-        accounts = self.parse_text(text, separator)
         logger.info(f"Parsed {len(accounts)} accounts from file: {file_path}")
         return accounts
 
@@ -4,16 +4,19 @@ Library service for managing multiple account libraries.
 Each library is an independent set of accounts, groups, and trash.
 """
 
-import json
+import hashlib
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 import uuid
 
+from PyQt6.QtCore import QRunnable, QThreadPool
+
 from ..config.settings import Settings
 from ..models.app_state import AppState
 from ..utils.exceptions import LibraryError
+from ..utils.json_io import dumps_json, load_json, loads_json, save_json, write_atomic
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -49,6 +52,24 @@ class LibraryInfo:
         )
 
 
+class _WriteRunnable(QRunnable):
+    """Writes serialized library data on a worker thread."""
+
+    def __init__(self, service: 'LibraryService', path: Path, raw: bytes):
+        super().__init__()
+        self._service = service
+        self._path = path
+        self._raw = raw
+
+    def run(self) -> None:
+        try:
+            write_atomic(self._path, self._raw)
+        except Exception as e:
+            # Forget the digest so the next save retries the write
+            self._service._file_digests.pop(self._path, None)
+            logger.error(f"Failed to write library state {self._path}: {e}")
+
+
 class LibraryService:
     """
     Service for managing multiple account libraries.
@@ -67,6 +88,20 @@ class LibraryService:
         self.data_dir = data_dir or Settings.DATA_DIR
         self.index_file = self.data_dir / Settings.LIBRARIES_INDEX_FILE
         self._current_library_id: Optional[str] = None
+        # Digest of each library file's last known content, to skip no-op saves
+        self._file_digests: dict[Path, bytes] = {}
+        # Background writes run one at a time, so they land in submission order
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
+
+    def wait_for_writes(self) -> None:
+        """Block until all background library writes have finished."""
+        self._write_pool.waitForDone()
+
+    @staticmethod
+    def _digest(raw: bytes) -> bytes:
+        """Get a short content digest of serialized library data."""
+        return hashlib.blake2b(raw, digest_size=16).digest()
 
     def _ensure_dir(self) -> None:
         """Ensure data directory exists."""
@@ -81,8 +116,7 @@ class LibraryService:
             }
 
         try:
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(self.index_file)
         except Exception as e:
             logger.warning(f"Failed to load library index: {e}")
             return {
@@ -94,8 +128,7 @@ class LibraryService:
         """Save library index to file."""
         self._ensure_dir()
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            save_json(self.index_file, data)
         except Exception as e:
             logger.error(f"Failed to save library index: {e}")
             raise LibraryError("Failed to save library index", e)
@@ -249,8 +282,7 @@ class LibraryService:
         # Create empty library file
         try:
             empty_state = AppState()
-            with open(library.file_path, 'w', encoding='utf-8') as f:
-                json.dump(empty_state.to_dict(), f, ensure_ascii=False, indent=2)
+            save_json(library.file_path, empty_state.to_dict())
         except Exception as e:
             raise LibraryError(f"Failed to create library file", e)
 
@@ -364,7 +396,8 @@ class LibraryService:
                 'was_current': index.get('current') == library_id
             }
         else:
-            # Delete the library file
+            # Delete the library file (after any queued write to it lands)
+            self.wait_for_writes()
             try:
                 if library_to_delete.file_path.exists():
                     library_to_delete.file_path.unlink()
@@ -423,6 +456,7 @@ class LibraryService:
         """
         library_dict = backup_data['library']
         library = LibraryInfo.from_dict(library_dict)
+        self.wait_for_writes()
         try:
             if library.file_path.exists():
                 library.file_path.unlink()
@@ -440,25 +474,34 @@ class LibraryService:
         Returns:
             AppState for the library.
         """
+        # A queued background write may still be replacing this file
+        self.wait_for_writes()
+
         if not library.file_path.exists():
             logger.info(f"Library file not found, creating empty state: {library.file_path}")
             return AppState()
 
         try:
-            with open(library.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return AppState.from_dict(data)
+            raw = library.file_path.read_bytes()
+            state = AppState.from_dict(loads_json(raw))
+            self._file_digests[library.file_path] = self._digest(raw)
+            return state
         except Exception as e:
             logger.error(f"Failed to load library state: {e}")
             return AppState()
 
-    def save_library_state(self, library: LibraryInfo, state: AppState) -> None:
+    def save_library_state(self, library: LibraryInfo, state: AppState, background: bool = False) -> None:
         """
         Save application state to a library file.
 
+        The state is always serialized on the calling thread, so later
+        changes to it cannot leak into the saved snapshot.
+
         Args:
             library: The library to save to.
             state: The state to save.
+            background: If True, write the file on a worker thread and
+                return immediately; write errors are logged, not raised.
 
         Raises:
             LibraryError: If save fails.
@@ -466,10 +509,22 @@ class LibraryService:
         self._ensure_dir()
 
         try:
-            with open(library.file_path, 'w', encoding='utf-8') as f:
-                json.dump(state.to_dict(), f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved library state: {library.name}")
+            raw = dumps_json(state.to_dict())
+            digest = self._digest(raw)
+            if self._file_digests.get(library.file_path) == digest and library.file_path.exists():
+                logger.debug(f"Library state unchanged, skipped save: {library.name}")
+                return
+            self._file_digests[library.file_path] = digest
+            if background:
+                self._write_pool.start(_WriteRunnable(self, library.file_path, raw))
+                logger.debug(f"Queued library state save: {library.name}")
+                return
+            # Keep ordering with any queued background write to the same file
+            self.wait_for_writes()
+            write_atomic(library.file_path, raw)
+            logger.debug(f"Saved library state: {library.name}")
         except Exception as e:
+            self._file_digests.pop(library.file_path, None)
             logger.error(f"Failed to save library state: {e}")
             raise LibraryError(f"Failed to save library: {library.name}", e)
 
@@ -2,15 +2,49 @@
 Time synchronization service for accurate TOTP generation.
 """
 
+import calendar
+import json
+import threading
 import time
-import urllib.request
-from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Optional
 
+from ..config.settings import Settings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1
+    )
+}
+
+
+def parse_http_date(date_str: str) -> float:
+    """
+    Parse an RFC 1123 HTTP date (e.g. "Sun, 06 Nov 1994 08:49:37 GMT").
+
+    Month names are matched against a fixed table rather than with
+    time.strptime(), whose %b depends on the process locale.
+
+    Returns:
+        Unix timestamp.
+
+    Raises:
+        ValueError: If the string is not an RFC 1123 GMT date.
+    """
+    try:
+        _, day, month, year, clock, zone = date_str.split()
+        hour, minute, second = clock.split(':')
+        if zone != 'GMT':
+            raise ValueError
+        return float(calendar.timegm((
+            int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second)
+        )))
+    except (ValueError, KeyError):
+        raise ValueError(f"Unsupported HTTP date: {date_str!r}") from None
+
 
 class TimeService:
     """
@@ -18,20 +52,83 @@ class TimeService:
 
     This service fetches time from Google's servers to ensure accurate
     TOTP code generation, even if the local system clock is off.
+
+    The last measured offset is cached on disk; startup uses the cached
+    value and only a stale offset is re-fetched, on a background thread.
     """
 
     # Google's homepage is used as a reliable time source
     TIME_SERVER_URL = 'https://www.google.com'
     TIMEOUT = 5  # seconds
 
-    def __init__(self):
-        """Initialize the time service and calculate initial offset."""
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize the time service from the cached offset.
+
+        Args:
+            cache_file: File caching the last offset. If None, uses default from Settings.
+        """
+        self.cache_file = cache_file or Settings.TIME_OFFSET_FILE
         self._time_offset: float = 0.0
         self._last_sync: float = 0.0
         self._sync_interval: float = 3600.0  # Re-sync every hour
+        self._sync_thread: Optional[threading.Thread] = None
 
-        # Calculate initial offset
-        self._time_offset = self._calculate_offset()
+        # Use the cached offset if it is fresh; otherwise fetch without blocking startup
+        if not self._load_cached_offset():
+            self._start_background_sync()
+
+    def _load_cached_offset(self) -> bool:
+        """
+        Load the cached offset if it was measured within the sync interval.
+
+        Returns:
+            True if a fresh cached offset was loaded.
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            offset = float(data['offset'])
+            fetched_at = float(data['fetched_at'])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to load cached time offset: {e}")
+            return False
+
+        if not 0 <= time.time() - fetched_at < self._sync_interval:
+            return False
+
+        self._time_offset = offset
+        self._last_sync = fetched_at
+        logger.debug(f"Using cached time offset: {offset:.2f} seconds")
+        return True
+
+    def _save_cached_offset(self, offset: float, fetched_at: float) -> None:
+        """Save the measured offset so the next startup can skip the fetch."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'offset': offset, 'fetched_at': fetched_at}, f)
+        except Exception as e:
+            logger.warning(f"Failed to cache time offset: {e}")
+
+    def _start_background_sync(self) -> None:
+        """Re-measure the offset on a daemon thread (no-op if one is running)."""
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            return
+        # Counts as an attempt, so an offline clock is retried once per interval
+        self._last_sync = time.time()
+        self._sync_thread = threading.Thread(
+            target=self._sync_in_background, name="TimeSync", daemon=True
+        )
+        self._sync_thread.start()
+
+    def _sync_in_background(self) -> None:
+        """Thread body: keep the previous offset if the fetch fails."""
+        offset = self._fetch_offset()
+        if offset is not None:
+            self._time_offset = offset
 
     def _get_internet_time(self) -> Optional[float]:
         """
@@ -40,15 +137,37 @@ class TimeService:
         Returns:
             Unix timestamp from server, or None if failed.
         """
+        # Imported here: it pulls in http.client/ssl, which startup never needs
+        # (this runs on the background sync thread)
+        import urllib.request
+
         try:
-            response = urllib.request.urlopen(self.TIME_SERVER_URL, timeout=self.TIMEOUT)
-            date_str = response.headers['Date']
-            server_time = parsedate_to_datetime(date_str)
-            return server_time.timestamp()
+            # HEAD: only the Date header is needed, so skip downloading the page body
+            request = urllib.request.Request(self.TIME_SERVER_URL, method='HEAD')
+            with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                date_str = response.headers['Date']
+            return parse_http_date(date_str)
         except Exception as e:
             logger.warning(f"Failed to get internet time: {e}")
             return None
 
+    def _fetch_offset(self) -> Optional[float]:
+        """
+        Measure the offset against internet time and cache it.
+
+        Returns:
+            Time offset in seconds, or None if the server could not be reached.
+        """
+        internet_time = self._get_internet_time()
+        if internet_time is None:
+            return None
+        local_time = time.time()
+        offset = internet_time - local_time
+        self._last_sync = local_time
+        self._save_cached_offset(offset, local_time)
+        logger.info(f"Time offset calculated: {offset:.2f} seconds")
+        return offset
+
     def _calculate_offset(self) -> float:
         """
         Calculate offset between local time and internet time.
@@ -56,12 +175,8 @@ class TimeService:
         Returns:
             Time offset in seconds (positive if local clock is behind).
         """
-        internet_time = self._get_internet_time()
-        if internet_time is not None:
-            local_time = time.time()
-            offset = internet_time - local_time
-            self._last_sync = time.time()
-            logger.info(f"Time offset calculated: {offset:.2f} seconds")
+        offset = self._fetch_offset()
+        if offset is not None:
             return offset
         logger.warning("Could not calculate time offset, using local time")
         return 0.0
@@ -69,9 +184,9 @@ class TimeService:
     @property
     def time_offset(self) -> float:
         """Get the current time offset."""
-        # Check if we need to re-sync
+        # Re-sync in the background when stale; callers never wait on the network
         if time.time() - self._last_sync > self._sync_interval:
-            self._time_offset = self._calculate_offset()
+            self._start_background_sync()
         return self._time_offset
 
     def get_accurate_time(self) -> float:
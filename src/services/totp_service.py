@@ -2,10 +2,12 @@
 TOTP (Time-based One-Time Password) generation service.
 """
 
+import base64
+import binascii
+import hmac
+import struct
 import time
-from typing import Optional
-
-import pyotp
+from typing import Iterable, Optional
 
 from ..config.settings import Settings
 from ..utils.exceptions import InvalidSecretError
@@ -19,7 +21,7 @@ class TotpService:
     """
     Service for generating TOTP 2FA codes.
 
-    Uses pyotp library for RFC 6238 compliant TOTP generation.
+    Implements RFC 6238 TOTP on top of the hmac module (OpenSSL-backed SHA-1).
     """
 
     def __init__(self, period: int = Settings.TOTP_PERIOD):
@@ -30,6 +32,110 @@ class TotpService:
             period: TOTP time period in seconds (default 30).
         """
         self.period = period
+        # Base32-decoded HMAC keys keyed by the raw secret string, so code
+        # generation never re-decodes a secret.
+        self._key_cache: dict[str, bytes] = {}
+        # Secrets that failed to decode, so they are not re-parsed every refresh
+        self._invalid_secrets: set[str] = set()
+        # Codes of the current time step keyed by secret; a code only changes
+        # when the counter advances, so repeated requests skip the HMAC.
+        self._code_cache: dict[str, str] = {}
+        self._code_counter: Optional[int] = None
+
+    def _get_key(self, secret: str) -> bytes:
+        """
+        Get the decoded HMAC key for a secret, decoding it on first use.
+
+        Args:
+            secret: Base32 encoded secret key (may contain spaces / lowercase).
+
+        Returns:
+            The raw key bytes.
+
+        Raises:
+            binascii.Error: If the secret is not valid base32.
+        """
+        key = self._key_cache.get(secret)
+        if key is None:
+            if secret in self._invalid_secrets:
+                raise binascii.Error("Invalid base32 secret")
+            try:
+                key = self._decode_secret(secret)
+            except ValueError:  # binascii.Error, or non-ASCII input
+                self._invalid_secrets.add(secret)
+                raise
+            self._key_cache[secret] = key
+        return key
+
+    def _codes_for_counter(self, counter: int) -> dict[str, str]:
+        """Get the code cache for a time step, dropping codes of older steps."""
+        if counter != self._code_counter:
+            self._code_cache.clear()
+            self._code_counter = counter
+        return self._code_cache
+
+    def _code_at(self, secret: str, counter: int) -> str:
+        """
+        Get the code of a secret for a time step, computing it once per step.
+
+        Raises:
+            binascii.Error: If the secret is not valid base32.
+        """
+        cache = self._codes_for_counter(counter)
+        code = cache.get(secret)
+        if code is None:
+            code = self._hotp(self._get_key(secret), counter)
+            cache[secret] = code
+        return code
+
+    @staticmethod
+    def _decode_secret(secret: str) -> bytes:
+        """
+        Decode a base32 secret (spaces / lowercase / missing padding allowed).
+
+        Args:
+            secret: Base32 encoded secret key.
+
+        Returns:
+            The raw key bytes.
+
+        Raises:
+            binascii.Error: If the secret is not valid base32.
+        """
+        clean_secret = secret.strip().replace(' ', '').upper()
+        padding = '=' * (-len(clean_secret) % 8)
+        return base64.b32decode(clean_secret + padding, casefold=True)
+
+    @staticmethod
+    def _hotp(key: bytes, counter: int, digits: int = Settings.TOTP_DIGITS) -> str:
+        """
+        Compute an RFC 4226 HOTP value (HMAC-SHA1 + dynamic truncation).
+
+        Args:
+            key: Raw HMAC key.
+            counter: Moving factor (the TOTP time step).
+            digits: Number of digits in the code.
+
+        Returns:
+            Zero-padded code string.
+        """
+        return TotpService._truncate(hmac.digest(key, struct.pack('>Q', counter), 'sha1'), digits)
+
+    @staticmethod
+    def _truncate(digest: bytes, digits: int = Settings.TOTP_DIGITS) -> str:
+        """
+        Apply HOTP dynamic truncation to an HMAC-SHA1 digest.
+
+        Args:
+            digest: 20-byte HMAC-SHA1 digest.
+            digits: Number of digits in the code.
+
+        Returns:
+            Zero-padded code string.
+        """
+        offset = digest[-1] & 0x0F
+        code = int.from_bytes(digest[offset:offset + 4], 'big') & 0x7FFFFFFF
+        return str(code % 10 ** digits).zfill(digits)
 
     def generate_code(self, secret: str) -> str:
         """
@@ -48,20 +154,84 @@ class TotpService:
             raise InvalidSecretError(secret or "", "Empty secret key")
 
         try:
-            # Clean up the secret (remove spaces, convert to uppercase)
-            clean_secret = secret.strip().replace(' ', '').upper()
-
-            # Get accurate time
-            accurate_time = get_accurate_time()
-
-            # Generate TOTP using the accurate time
-            totp = pyotp.TOTP(clean_secret, interval=self.period)
-            return totp.at(accurate_time)
+            # Generate TOTP for the current (accurate) time step
+            return self._code_at(secret, self.get_counter())
 
         except Exception as e:
             logger.error(f"Failed to generate TOTP code: {e}")
             raise InvalidSecretError(secret, str(e))
 
+    def get_counter(self) -> int:
+        """
+        Get the TOTP time-step counter for the current accurate time.
+
+        Returns:
+            Number of whole periods elapsed since the Unix epoch.
+        """
+        return int(get_accurate_time()) // self.period
+
+    def generate_codes(self, secrets: Iterable[str]) -> dict[str, Optional[str]]:
+        """
+        Generate TOTP codes for many secrets at once.
+
+        The time-step counter is identical for every secret within a period,
+        so it is computed once and only the HMAC runs per (pre-decoded) key,
+        and only for secrets whose code is not cached for this step yet.
+
+        Args:
+            secrets: Base32 encoded secret keys.
+
+        Returns:
+            Mapping of each non-empty secret to its 6-digit code, or None if
+            the secret is invalid.
+        """
+        # Pack the shared counter once; a cache miss is then one C-level
+        # one-shot HMAC (hmac.digest) plus truncation.
+        counter = self.get_counter()
+        cache = self._codes_for_counter(counter)
+        message = struct.pack('>Q', counter)
+        get_key = self._get_key
+        truncate = self._truncate
+        digest = hmac.digest
+
+        codes: dict[str, Optional[str]] = {}
+        for secret in secrets:
+            if not secret or secret in codes:
+                continue
+            code = cache.get(secret)
+            if code is None:
+                try:
+                    code = truncate(digest(get_key(secret), message, 'sha1'))
+                except Exception:
+                    codes[secret] = None
+                    continue
+                cache[secret] = code
+            codes[secret] = code
+        return codes
+
+    def code_at(self, secret: str, counter: int) -> Optional[str]:
+        """
+        Get the code of one secret for a time step the caller already read.
+
+        Lets a sweep read get_counter() once and then look codes up one
+        secret at a time (e.g. only for the table rows being painted).
+        Codes are cached per step, so repeated lookups skip the HMAC.
+
+        Args:
+            secret: Base32 encoded secret key.
+            counter: Time-step counter, as returned by get_counter().
+
+        Returns:
+            6-digit TOTP code as string, or None if the secret is empty or
+            invalid.
+        """
+        if not secret:
+            return None
+        try:
+            return self._code_at(secret, counter)
+        except Exception:
+            return None
+
     def generate_code_safe(self, secret: str) -> Optional[str]:
         """
         Generate a TOTP code, returning None on error instead of raising.
@@ -102,12 +272,9 @@ class TotpService:
             return False
 
         try:
-            clean_secret = secret.strip().replace(' ', '').upper()
-            totp = pyotp.TOTP(clean_secret, interval=self.period)
-
-            # Verify with a small time window to account for clock drift
-            accurate_time = get_accurate_time()
-            return totp.verify(code, for_time=accurate_time)
+            # Compare against the current time step (constant-time compare)
+            expected = self._code_at(secret, self.get_counter())
+            return hmac.compare_digest(expected, code.strip())
 
         except Exception as e:
             logger.warning(f"TOTP verification failed: {e}")
@@ -139,9 +306,8 @@ class TotpService:
             if len(clean_secret) < 16:
                 return False
 
-            # Try to create a TOTP object and generate a code
-            totp = pyotp.TOTP(clean_secret)
-            totp.now()  # This will fail if the secret is truly invalid
+            # Decoding will fail if the secret is truly invalid
+            TotpService._decode_secret(clean_secret)
             return True
         except Exception:
             return False
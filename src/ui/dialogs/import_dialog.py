@@ -7,10 +7,10 @@ from typing import List, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QFileDialog, QComboBox, QWidget, QFrame,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QTableView, QHeaderView, QAbstractItemView,
     QSplitter
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QIcon, QColor
 
 from ...models.account import Account
@@ -19,6 +19,69 @@ from ..theme import get_theme, get_theme_manager
 from ..icons import icon_import, icon_file
 
 
+class ImportPreviewModel(QAbstractTableModel):
+    """Read-only preview rows served straight from the parsed accounts."""
+
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._accounts: List[Account] = []
+        self._email_color = QColor()
+        self._status_color = QColor()
+
+    def set_accounts(self, accounts: List[Account]) -> None:
+        """Replace the previewed accounts (colors follow the current theme)."""
+        self.beginResetModel()
+        self._accounts = accounts
+        self._email_color = QColor(Qt.GlobalColor.white if get_theme_manager().is_dark else Qt.GlobalColor.black)
+        self._status_color = QColor(get_theme().success)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        account = self._accounts[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return account.email
+            if column == 1:
+                # Password (masked)
+                return "••••••••" if account.password else "-"
+            if column == 2:
+                backup = getattr(account, 'backup', '') or getattr(account, 'backup_email', '') or ''
+                return backup if backup else "-"
+            if column == 3:
+                # 2FA Secret (masked)
+                return "••••••••" if account.secret else "-"
+            return "OK"
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 0:
+                return self._email_color
+            if column == 4:
+                # Status - OK indicator using theme success color
+                return self._status_color
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 4:
+            return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+
 class ImportDialog(QDialog):
     """Dialog for importing accounts from text or file."""
 
@@ -27,6 +90,7 @@ class ImportDialog(QDialog):
         self.language = language
         self.import_service = get_import_service()
         self.imported_accounts: List[Account] = []
+        self._status_style: Optional[str] = None  # Last stylesheet applied to status_label
 
         self._init_ui()
         self._apply_theme()
@@ -196,17 +260,17 @@ class ImportDialog(QDialog):
         preview_header.addStretch()
         preview_layout.addLayout(preview_header)
 
-        # Preview table
-        self.preview_table = QTableWidget()
+        # Preview table (model-backed: only visible rows are rendered)
+        self.preview_table = QTableView()
         self.preview_table.setObjectName("previewTable")
-        self.preview_table.setColumnCount(5)
-        self.preview_table.setHorizontalHeaderLabels([
+        self.preview_model = ImportPreviewModel([
             "邮箱" if zh else "Email",
             "密码" if zh else "Password",
             "备用邮箱" if zh else "Backup",
             "2FA密钥" if zh else "2FA Secret",
             "状态" if zh else "Status"
-        ])
+        ], self.preview_table)
+        self.preview_table.setModel(self.preview_model)
         self.preview_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.preview_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.preview_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
@@ -478,15 +542,19 @@ class ImportDialog(QDialog):
 
         if file_path:
             try:
-                # Try different encodings
+                # Read the file once, then try different encodings on the bytes
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
                 content = None
                 for encoding in ['utf-8', 'utf-8-sig', 'gbk', 'gb2312', 'latin-1']:
                     try:
-                        with open(file_path, 'r', encoding=encoding) as f:
-                            content = f.read()
+                        content = raw.decode(encoding)
                         break
                     except UnicodeDecodeError:
                         continue
+                if content and '\r' in content:
+                    # Same newline handling as a text-mode read
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
 
                 if content:
                     self.text_input.setPlainText(content)
@@ -502,7 +570,7 @@ class ImportDialog(QDialog):
         text = self.text_input.toPlainText().strip()
 
         # Clear preview
-        self.preview_table.setRowCount(0)
+        self.preview_model.set_accounts([])
         self.imported_accounts = []
 
         if not text:
@@ -518,64 +586,42 @@ class ImportDialog(QDialog):
             self.imported_accounts = accounts
 
             # Update preview table
-            self.preview_table.setRowCount(len(accounts))
-
-            for row, account in enumerate(accounts):
-                # Email
-                email_item = QTableWidgetItem(account.email)
-                email_item.setForeground(Qt.GlobalColor.white if get_theme_manager().is_dark else Qt.GlobalColor.black)
-                self.preview_table.setItem(row, 0, email_item)
-
-                # Password (masked)
-                pwd_text = "••••••••" if account.password else "-"
-                pwd_item = QTableWidgetItem(pwd_text)
-                self.preview_table.setItem(row, 1, pwd_item)
-
-                # Backup
-                backup = getattr(account, 'backup', '') or getattr(account, 'backup_email', '') or ''
-                backup_item = QTableWidgetItem(backup if backup else "-")
-                self.preview_table.setItem(row, 2, backup_item)
-
-                # 2FA Secret (masked)
-                secret_text = "••••••••" if account.secret else "-"
-                secret_item = QTableWidgetItem(secret_text)
-                self.preview_table.setItem(row, 3, secret_item)
-
-                # Status - OK indicator using theme success color
-                status_item = QTableWidgetItem("OK")
-                status_item.setForeground(QColor(t.success))
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.preview_table.setItem(row, 4, status_item)
+            self.preview_model.set_accounts(accounts)
 
             # Update status
             if accounts:
-                self.status_label.setText(
+                self._set_status(
                     f"已检测到 {len(accounts)} 个账户" if zh else
-                    f"Found {len(accounts)} accounts"
+                    f"Found {len(accounts)} accounts",
+                    f"color: {t.success}; font-weight: 500;"
                 )
-                self.status_label.setStyleSheet(f"color: {t.success}; font-weight: 500;")
                 self.count_label.setText(
                     f"将导入 {len(accounts)} 个账户" if zh else
                     f"Will import {len(accounts)} accounts"
                 )
                 self.btn_import.setEnabled(True)
             else:
-                self.status_label.setText("未检测到有效账户" if zh else "No valid accounts")
-                self.status_label.setStyleSheet(f"color: {t.warning};")
+                self._set_status("未检测到有效账户" if zh else "No valid accounts", f"color: {t.warning};")
                 self.count_label.setText("")
                 self.btn_import.setEnabled(False)
 
         except Exception as e:
-            self.status_label.setText("解析错误" if zh else "Parse error")
-            self.status_label.setStyleSheet(f"color: {t.error};")
+            self._set_status("解析错误" if zh else "Parse error", f"color: {t.error};")
             self.count_label.setText(str(e))
             self.btn_import.setEnabled(False)
 
     def _show_error(self, message: str):
         """Show error in status."""
         t = get_theme()
-        self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {t.error};")
+        self._set_status(message, f"color: {t.error};")
+
+    def _set_status(self, text: str, style: str):
+        """Set the status text, re-applying the stylesheet only when it changes."""
+        self.status_label.setText(text)
+        # Preview runs on every keystroke; skip re-parsing an identical stylesheet
+        if style != self._status_style:
+            self._status_style = style
+            self.status_label.setStyleSheet(style)
 
     def _do_import(self):
         """Perform the import."""
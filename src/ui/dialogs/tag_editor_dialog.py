@@ -357,9 +357,14 @@ class TagEditorDialog(QDialog):
             if item.widget():
                 item.widget().deleteLater()
 
+        # Index the groups once instead of scanning them for every tag
+        groups_by_name: dict[str, Group] = {}
+        for group in self.available_groups:
+            groups_by_name.setdefault(group.name, group)
+
         # Add current tags
         for tag_name in self.current_tags:
-            group = self._get_group_by_name(tag_name)
+            group = groups_by_name.get(tag_name)
             color_hex = group.color_hex if group else GROUP_COLORS.get('gray', '#6B7280')
             chip = TagChip(tag_name, color_hex, removable=True)
             chip.removed.connect(self._remove_tag)
@@ -372,8 +377,9 @@ class TagEditorDialog(QDialog):
                 item.widget().deleteLater()
 
         # Add available tags (groups not in current tags)
+        current = set(self.current_tags)
         for group in self.available_groups:
-            if group.name not in self.current_tags:
+            if group.name not in current:
                 chip = self._create_available_chip(group)
                 self.available_tags_layout.insertWidget(self.available_tags_layout.count() - 1, chip)
 
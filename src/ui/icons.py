@@ -9,15 +9,26 @@ from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import QApplication
 
 
+# Rendered icons keyed by (svg, size, color, device pixel ratio). Lists build
+# the same few icons for every row, so each is parsed and rendered once.
+_pixmap_cache: dict[tuple, QPixmap] = {}
+
+
 def _render_svg(svg_content: str, size: int, color: str = "#6B7280") -> QPixmap:
     """Render SVG content to a QPixmap with the specified color."""
-    # Replace color placeholder
-    svg_data = svg_content.replace("{color}", color)
-
     # Get device pixel ratio for HiDPI
     screen = QApplication.primaryScreen()
     dpr = screen.devicePixelRatio() if screen else 1.0
 
+    key = (svg_content, size, color, dpr)
+    cached = _pixmap_cache.get(key)
+    if cached is not None:
+        # Implicitly shared copy: callers that paint on it detach from the cache
+        return QPixmap(cached)
+
+    # Replace color placeholder
+    svg_data = svg_content.replace("{color}", color)
+
     # Create high-DPI pixmap
     real_size = int(size * dpr)
     pixmap = QPixmap(real_size, real_size)
@@ -31,7 +42,8 @@ def _render_svg(svg_content: str, size: int, color: str = "#6B7280") -> QPixmap:
     renderer.render(painter, QRectF(0, 0, size, size))
     painter.end()
 
-    return pixmap
+    _pixmap_cache[key] = pixmap
+    return QPixmap(pixmap)
 
 
 # ============== Navigation Icons ==============
@@ -4,6 +4,8 @@ Modern minimal design with library management and archive features.
 """
 
 import logging
+from collections import Counter
+from functools import partial
 from typing import Optional, List, Dict, Set
 import time
 
@@ -12,10 +14,10 @@ from PyQt6.QtWidgets import (
     QLineEdit, QFrame, QScrollArea, QMenu, QApplication, QProgressBar,
     QDialog, QListWidget, QListWidgetItem, QMessageBox, QInputDialog, QCheckBox,
     QWidgetAction, QGraphicsDropShadowEffect, QToolButton, QTextEdit,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+    QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QColor, QCursor, QBrush, QPalette
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal, QSize, QEvent
+from PyQt6.QtGui import QIcon, QColor, QCursor, QPalette
 
 from ..models.app_state import AppState
 from ..models.account import Account
@@ -27,6 +29,7 @@ from ..services.archive_service import get_archive_service, ArchiveInfo
 from ..config.translations import get_translation
 
 from .dialogs.tag_editor_dialog import TagEditorDialog
+from .widgets import AccountTableModel, GroupTagDelegate
 from .theme import get_theme_manager, get_theme
 from .icons import (
     icon_key, icon_search, icon_sun, icon_moon, icon_settings,
@@ -40,6 +43,31 @@ from .icons import (
 
 logger = logging.getLogger(__name__)
 
+# Table view column titles per language (index == column)
+TABLE_COLUMN_NAMES: Dict[str, tuple] = {
+    'zh': ("#", "邮箱", "密码", "辅助邮箱", "2FA密钥", "验证码", "分组", "备注"),
+    'en': ("#", "Email", "Password", "Backup", "2FA Key", "Code", "Groups", "Notes"),
+}
+
+# Toast shown after copying a table cell, prebuilt per language and column
+TABLE_COPY_TOASTS: Dict[str, tuple] = {
+    'zh': tuple(f"已复制 {name}" for name in TABLE_COLUMN_NAMES['zh']),
+    'en': tuple(f"Copied {name}" for name in TABLE_COLUMN_NAMES['en']),
+}
+
+# Width the group tags of an account card wrap at
+# (320 card - 24 margins - 36 tag indent - scrollbar)
+CARD_TAGS_WIDTH = 250
+
+# Account cards are built in batches of this size, the next one when the
+# card list is scrolled near its end
+CARD_BATCH_SIZE = 100
+
+# Event types MainWindow.eventFilter acts on (it sees every event in the app)
+_FILTERED_EVENT_TYPES = frozenset((
+    QEvent.Type.MouseButtonPress, QEvent.Type.Hide, QEvent.Type.FocusOut,
+))
+
 
 class SelectionManager:
     """Unified multi-selection logic manager.
@@ -83,6 +111,10 @@ class SelectionManager:
         self._selected.clear()
         self._anchor_index = None
 
+    def discard(self, account: Account) -> None:
+        """Unselect an account if it is selected (e.g. after it was deleted)."""
+        self._selected.pop(id(account), None)
+
     def toggle(self, account: Account, index: int) -> None:
         """Toggle current item selection, update anchor."""
         acc_id = id(account)
@@ -206,6 +238,9 @@ class ClickableFrame(QFrame):
 class ToastWidget(QFrame):
     """Toast notification widget with optional action button and iOS-style frosted glass effect."""
 
+    # Max remembered toast sizes (messages embed names and counts)
+    SIZE_CACHE_LIMIT = 64
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("toast")
@@ -230,6 +265,14 @@ class ToastWidget(QFrame):
         self._hide_timer.timeout.connect(self._on_timeout)
 
         self._action_callback = None
+        # (message, action text) -> size, so repeated toasts skip the layout pass
+        self._size_cache: dict[tuple, QSize] = {}
+
+    def changeEvent(self, event):
+        """Forget cached sizes when the font or stylesheet changes."""
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange):
+            self._size_cache.clear()
+        super().changeEvent(event)
 
     def show_message(self, message: str, duration: int = 2000, action_text: str = None, action_callback=None, center: bool = False):
         """Show a toast message with optional action button.
@@ -245,7 +288,8 @@ class ToastWidget(QFrame):
         self._action_callback = action_callback
 
         # Show/hide action button
-        if action_text and action_callback:
+        has_action = bool(action_text and action_callback)
+        if has_action:
             self._action_btn.setText(action_text)
             self._action_btn.setVisible(True)
             try:
@@ -257,7 +301,15 @@ class ToastWidget(QFrame):
             self._action_btn.setVisible(False)
 
         self.setVisible(True)
-        self.adjustSize()
+        size_key = (message, action_text if has_action else None)
+        size = self._size_cache.get(size_key)
+        if size is None:
+            self.adjustSize()
+            if len(self._size_cache) >= self.SIZE_CACHE_LIMIT:
+                self._size_cache.clear()
+            self._size_cache[size_key] = self.size()
+        else:
+            self.resize(size)
 
         # Position toast
         if self.parent():
@@ -418,8 +470,8 @@ class BounceScrollArea(QScrollArea):
         super().wheelEvent(event)
 
 
-class BounceTableWidget(QTableWidget):
-    """QTableWidget with iOS-style elastic rubber band effect.
+class BounceTableView(QTableView):
+    """QTableView with iOS-style elastic rubber band effect.
 
     Uses viewport geometry manipulation to create the bounce effect.
     """
@@ -549,6 +601,9 @@ class GroupButton(QFrame):
     clicked = pyqtSignal()
     rightClicked = pyqtSignal(object)  # Emits the global position
 
+    # Shared stylesheets keyed by (is_dark, selected); every refresh rebuilds the buttons
+    _styles: Dict[tuple, str] = {}
+
     def __init__(self, name: str, count: int, color_hex: str = None, is_all: bool = False, parent=None):
         super().__init__(parent)
         self.group_name = name
@@ -573,6 +628,7 @@ class GroupButton(QFrame):
         else:
             # Use colored dot for groups
             self.dot_label = QLabel()
+            self.dot_label.setObjectName("groupDot")
             self.dot_label.setFixedSize(10, 10)
             layout.addWidget(self.dot_label)
             self.icon_label = None
@@ -602,38 +658,43 @@ class GroupButton(QFrame):
         """Apply current theme style."""
         t = get_theme()
 
-        # Small square dot for all groups
-        # Light mode: pure black, Dark mode: softer gray
-        is_dark = get_theme_manager().is_dark
-        dot_color = "#6B7280" if is_dark else t.text_primary  # Gray-500 for dark mode
-        if self.dot_label:
-            self.dot_label.setStyleSheet(f"""
-                background-color: {dot_color};
-                border-radius: 2px;
-            """)
-
         # Icon for "All Accounts"
         if self.icon_label:
             pixmap = QIcon(icon_key(16, t.text_secondary if not self._selected else t.text_primary)).pixmap(16, 16)
             self.icon_label.setPixmap(pixmap)
 
-        # Frame style
-        if self._selected:
-            self.setStyleSheet(f"""
+        self.setStyleSheet(self._frame_style(self._selected))
+        # Name color lives in the palette, so hovering only swaps a color
+        self._set_name_color(t.text_primary if self._selected else t.text_secondary)
+
+    @classmethod
+    def _frame_style(cls, selected: bool) -> str:
+        """Stylesheet for the button and its labels, built once per theme and state."""
+        is_dark = get_theme_manager().is_dark
+        key = (is_dark, selected)
+        style = cls._styles.get(key)
+        if style is not None:
+            return style
+
+        t = get_theme()
+        # Small square dot for all groups
+        # Light mode: pure black, Dark mode: softer gray
+        dot_color = "#6B7280" if is_dark else t.text_primary  # Gray-500 for dark mode
+        if selected:
+            frame = f"""
                 GroupButton {{
                     background-color: {t.bg_hover};
                     border: none;
                     border-radius: 6px;
                 }}
-            """)
-            self.name_label.setStyleSheet(f"""
-                font-size: 13px;
-                font-weight: 500;
-                color: {t.text_primary};
-                background: transparent;
-            """)
+                QLabel#groupName {{
+                    font-size: 13px;
+                    font-weight: 500;
+                    background: transparent;
+                }}
+            """
         else:
-            self.setStyleSheet(f"""
+            frame = f"""
                 GroupButton {{
                     background-color: transparent;
                     border: none;
@@ -642,18 +703,24 @@ class GroupButton(QFrame):
                 GroupButton:hover {{
                     background-color: {t.bg_hover};
                 }}
-            """)
-            self.name_label.setStyleSheet(f"""
-                font-size: 13px;
-                color: {t.text_secondary};
+                QLabel#groupName {{
+                    font-size: 13px;
+                    background: transparent;
+                }}
+            """
+        style = frame + f"""
+            QLabel#groupDot {{
+                background-color: {dot_color};
+                border-radius: 2px;
+            }}
+            QLabel#groupCount {{
+                font-size: 12px;
+                color: {t.text_tertiary};
                 background: transparent;
-            """)
-
-        self.count_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {t.text_tertiary};
-            background: transparent;
-        """)
+            }}
+        """
+        cls._styles[key] = style
+        return style
 
     def mousePressEvent(self, event):
         """Handle mouse press."""
@@ -663,27 +730,22 @@ class GroupButton(QFrame):
             self.rightClicked.emit(event.globalPosition().toPoint())
         super().mousePressEvent(event)
 
+    def _set_name_color(self, color: str) -> None:
+        """Set the name label's text color through its palette (no stylesheet re-parse)."""
+        palette = self.name_label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+        self.name_label.setPalette(palette)
+
     def enterEvent(self, event):
-        """Handle mouse enter for hover effect."""
+        """Handle mouse enter for hover effect (the background is the :hover rule)."""
         if not self._selected:
-            t = get_theme()
-            self.setStyleSheet(f"""
-                GroupButton {{
-                    background-color: {t.bg_hover};
-                    border: none;
-                    border-radius: 6px;
-                }}
-            """)
-            self.name_label.setStyleSheet(f"""
-                font-size: 13px;
-                color: {t.text_primary};
-                background: transparent;
-            """)
+            self._set_name_color(get_theme().text_primary)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Handle mouse leave."""
-        self._apply_style()
+        if not self._selected:
+            self._set_name_color(get_theme().text_secondary)
         super().leaveEvent(event)
 
 
@@ -695,6 +757,9 @@ class EditableGroupItem(QFrame):
     drag_started = pyqtSignal(object)  # Emits self when drag starts
     dropped = pyqtSignal(object, object)  # Emits (dragged_item, target_item)
 
+    # Shared row stylesheets keyed by is_dark
+    _styles: Dict[bool, str] = {}
+
     def __init__(self, group: Group, is_dark: bool = False, parent=None):
         super().__init__(parent)
         self.group = group
@@ -702,6 +767,7 @@ class EditableGroupItem(QFrame):
         self._drag_start_pos = None
         self._is_dragging = False
         self._drop_at_top = False
+        self._drop_indicator: Optional[bool] = None  # Edge drawn (True=top), None=none
 
         self.setFixedHeight(36)
         self.setAcceptDrops(True)
@@ -712,6 +778,7 @@ class EditableGroupItem(QFrame):
 
         # Drag handle (6-dot grip)
         self.drag_handle = QLabel("⋮⋮")
+        self.drag_handle.setObjectName("groupDragHandle")
         self.drag_handle.setFixedWidth(16)
         self.drag_handle.setCursor(Qt.CursorShape.OpenHandCursor)
         self.drag_handle.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -719,6 +786,7 @@ class EditableGroupItem(QFrame):
 
         # Black dot
         self.dot_label = QLabel()
+        self.dot_label.setObjectName("groupDot")
         self.dot_label.setFixedSize(8, 8)
         layout.addWidget(self.dot_label)
 
@@ -731,6 +799,7 @@ class EditableGroupItem(QFrame):
 
         # Delete button
         self.delete_btn = QPushButton("×")
+        self.delete_btn.setObjectName("groupDeleteBtn")
         self.delete_btn.setFixedSize(20, 20)
         self.delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.delete_btn.clicked.connect(lambda: self.deleted.emit(self.group.name))
@@ -751,23 +820,22 @@ class EditableGroupItem(QFrame):
 
     def _apply_style(self):
         """Apply styles."""
+        self._drop_indicator = None
+        self.setStyleSheet(self._row_style())
+
+    @classmethod
+    def _row_style(cls) -> str:
+        """Stylesheet for the row and its children, built once per theme."""
+        is_dark = get_theme_manager().is_dark
+        style = cls._styles.get(is_dark)
+        if style is not None:
+            return style
+
         t = get_theme()
-        # Drag handle style
-        self.drag_handle.setStyleSheet(f"""
-            font-size: 12px;
-            color: {t.text_tertiary};
-            letter-spacing: -2px;
-        """)
         # Small square dot
         # Light mode: pure black, Dark mode: softer gray
-        is_dark = get_theme_manager().is_dark
         dot_color = "#6B7280" if is_dark else t.text_primary  # Gray-500 for dark mode
-        self.dot_label.setStyleSheet(f"""
-            background-color: {dot_color};
-            border-radius: 2px;
-        """)
-        # Frame style
-        self.setStyleSheet(f"""
+        style = f"""
             EditableGroupItem {{
                 background-color: transparent;
                 border-radius: 6px;
@@ -775,10 +843,17 @@ class EditableGroupItem(QFrame):
             EditableGroupItem:hover {{
                 background-color: {t.bg_hover};
             }}
-        """)
-        # Seamless text input - no shift on focus
-        self.name_input.setStyleSheet(f"""
-            QLineEdit {{
+            QLabel#groupDragHandle {{
+                font-size: 12px;
+                color: {t.text_tertiary};
+                letter-spacing: -2px;
+            }}
+            QLabel#groupDot {{
+                background-color: {dot_color};
+                border-radius: 2px;
+            }}
+            /* Seamless text input - no shift on focus */
+            QLineEdit#groupNameInput {{
                 background-color: transparent;
                 border: 1px solid transparent;
                 border-radius: 4px;
@@ -787,14 +862,11 @@ class EditableGroupItem(QFrame):
                 padding: 4px 6px;
                 margin: 0;
             }}
-            QLineEdit:focus {{
+            QLineEdit#groupNameInput:focus {{
                 border: 1px solid {t.border};
                 background-color: {t.bg_primary};
             }}
-        """)
-        # Delete button
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
+            QPushButton#groupDeleteBtn {{
                 background-color: transparent;
                 border: none;
                 border-radius: 4px;
@@ -802,11 +874,13 @@ class EditableGroupItem(QFrame):
                 font-weight: 500;
                 color: {t.text_tertiary};
             }}
-            QPushButton:hover {{
+            QPushButton#groupDeleteBtn:hover {{
                 background-color: {t.text_primary};
                 color: {t.bg_primary};
             }}
-        """)
+        """
+        cls._styles[is_dark] = style
+        return style
 
     def mousePressEvent(self, event):
         """Start drag on handle area."""
@@ -888,24 +962,30 @@ class EditableGroupItem(QFrame):
         is_dark = get_theme_manager().is_dark
         is_top_half = y_pos < self.height() / 2
         self._drop_at_top = is_top_half
+        # dragMoveEvent fires on every mouse move; restyle only when the edge flips
+        if is_top_half == self._drop_indicator:
+            return
+        self._drop_indicator = is_top_half
 
         # Simple dark gray horizontal line
         indicator_color = "#6B7280" if is_dark else "#374151"
 
         if is_top_half:
             # Show line at top
-            self.setStyleSheet(f"""
+            self.setStyleSheet(self._row_style() + f"""
                 EditableGroupItem {{
                     background-color: transparent;
                     border-top: 2px solid {indicator_color};
+                    border-radius: 0px;
                 }}
             """)
         else:
             # Show line at bottom
-            self.setStyleSheet(f"""
+            self.setStyleSheet(self._row_style() + f"""
                 EditableGroupItem {{
                     background-color: transparent;
                     border-bottom: 2px solid {indicator_color};
+                    border-radius: 0px;
                 }}
             """)
 
@@ -1568,24 +1648,29 @@ class TrashDialog(QDialog):
             return
 
         self.empty_container.hide()
-        self.trash_list.show()
         self.btn_clear_all.setEnabled(True)
         self.btn_select_all.setVisible(True)
         self.btn_deselect_all.setVisible(True)
         self.select_info.setVisible(True)
 
-        for account in self.state.trash:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, account)
+        # Fill the list while it is hidden: a visible list re-lays out its row
+        # widgets on every insert, which made reloading a large trash quadratic
+        self.trash_list.hide()
+        try:
+            for account in self.state.trash:
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, account)
 
-            # Create custom widget
-            widget = TrashItemWidget(account, self.language)
-            widget.checked_changed = self._on_selection_changed
-            item.setSizeHint(widget.sizeHint())
+                # Create custom widget
+                widget = TrashItemWidget(account, self.language)
+                widget.checked_changed = self._on_selection_changed
+                item.setSizeHint(widget.sizeHint())
 
-            self._item_widgets[account] = widget
-            self.trash_list.addItem(item)
-            self.trash_list.setItemWidget(item, widget)
+                self._item_widgets[account] = widget
+                self.trash_list.addItem(item)
+                self.trash_list.setItemWidget(item, widget)
+        finally:
+            self.trash_list.show()
 
     def _on_item_clicked(self, item: QListWidgetItem):
         """Handle item click - toggle checkbox."""
@@ -1631,11 +1716,12 @@ class TrashDialog(QDialog):
         if not self.selected_accounts:
             return
 
-        # Move selected from trash back to accounts
-        for account in self.selected_accounts:
-            if account in self.state.trash:
-                self.state.trash.remove(account)
-                self.state.accounts.append(account)
+        # Move selected from trash back to accounts in one pass over the trash
+        # (by identity: accounts compare equal by email)
+        selected_ids = {id(a) for a in self.selected_accounts}
+        trash = self.state.trash
+        self.state.accounts.extend(a for a in trash if id(a) in selected_ids)
+        trash[:] = [a for a in trash if id(a) not in selected_ids]
 
         self._changed = True
         self._load_trash()
@@ -1651,9 +1737,8 @@ class TrashDialog(QDialog):
         reply = QMessageBox.question(self, "确认" if zh else "Confirm", msg)
 
         if reply == QMessageBox.StandardButton.Yes:
-            for account in self.selected_accounts:
-                if account in self.state.trash:
-                    self.state.trash.remove(account)
+            selected_ids = {id(a) for a in self.selected_accounts}
+            self.state.trash[:] = [a for a in self.state.trash if id(a) not in selected_ids]
             self._changed = True
             self._load_trash()
 
@@ -1711,11 +1796,39 @@ class MainWindowV2(QMainWindow):
         self.multi_select_mode: bool = False  # Multi-select mode
         self.selection_manager = SelectionManager()  # Unified selection management
         self.list_view_mode: bool = False  # False=card view, True=list view
+        self._table_accounts: List[Account] = []  # Accounts shown in table view, by row
+        self._table_rows: Optional[Dict[int, int]] = None  # id(account) -> table row, built on demand
+        self._card_accounts: List[Account] = []  # Accounts shown as cards, in order
         self.group_edit_mode: bool = False  # Group editing mode
         self.detail_edit_mode: bool = False  # Detail panel inline edit mode
         self.editable_fields: Dict[str, QLineEdit] = {}  # Editable field references
         self._pending_delete_backup: Optional[dict] = None  # For library delete undo
         self._menu_close_times: Dict[str, float] = {}  # Track menu close times
+        self._delete_confirm_dialog: Optional[tuple] = None  # (key, dialog, label, checkbox)
+        self._skip_delete_confirm: bool = False  # "Don't ask again" for this session
+
+        # Coalesce saves: mutations mark the state dirty, one write per burst
+        self._save_pending: bool = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
+
+        # Throttle search: the first keystroke filters at once, keystrokes
+        # arriving within the interval collapse into one trailing refresh
+        self._search_pending: bool = False
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(50)
+        self._search_timer.timeout.connect(self._flush_search)
+
+        # Multi-select clicks only update the selection; the check visuals
+        # and batch bar catch up once per event-loop pass (see
+        # _commit_selection_change), so rapid clicks share one repaint
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._commit_selection_change)
 
         # Setup
         self._init_window()
@@ -1739,15 +1852,18 @@ class MainWindowV2(QMainWindow):
 
     def eventFilter(self, obj, event) -> bool:
         """Handle events for click-outside detection."""
-        from PyQt6.QtCore import QEvent
-        from PyQt6.QtWidgets import QLineEdit
+        # Installed application-wide, so every resize, move and paint event
+        # passes through here; only presses, hides and focus-outs matter
+        etype = event.type()
+        if etype not in _FILTERED_EVENT_TYPES:
+            return super().eventFilter(obj, event)
 
         # Track library panel hide event
-        if obj == self.library_panel and event.type() == QEvent.Type.Hide:
+        if obj == self.library_panel and etype == QEvent.Type.Hide:
             self._menu_close_times["library_panel"] = time.time()
 
         # Handle click outside library panel to close it (since it's now a Tool window)
-        if event.type() == QEvent.Type.MouseButtonPress and hasattr(self, 'library_panel') and self.library_panel.isVisible():
+        if etype == QEvent.Type.MouseButtonPress and hasattr(self, 'library_panel') and self.library_panel.isVisible():
             click_pos = event.globalPosition().toPoint()
             panel_rect = self.library_panel.geometry()
 
@@ -1768,21 +1884,21 @@ class MainWindowV2(QMainWindow):
         # Notes edit event handling (check both widget and viewport)
         if hasattr(self, 'notes_edit'):
             is_notes_widget = obj == self.notes_edit or obj == self.notes_edit.viewport()
-            if is_notes_widget and event.type() == QEvent.Type.MouseButtonPress:
+            if is_notes_widget and etype == QEvent.Type.MouseButtonPress:
                 # Schedule the click handler to run after event processing
                 QTimer.singleShot(10, self._handle_notes_click)
-            elif obj == self.notes_edit and event.type() == QEvent.Type.FocusOut:
+            elif obj == self.notes_edit and etype == QEvent.Type.FocusOut:
                 self._handle_notes_focus_out()
 
         # Table notes inline edit - detect click outside
-        if event.type() == QEvent.Type.MouseButtonPress:
+        if etype == QEvent.Type.MouseButtonPress:
             if hasattr(self, '_table_notes_editing') and self._table_notes_editing:
                 if hasattr(self, '_table_notes_edit') and self._table_notes_edit:
                     # Check if click is outside the edit widget
                     if obj != self._table_notes_edit:
                         QTimer.singleShot(0, self._finish_table_notes_edit)
 
-        if event.type() == QEvent.Type.MouseButtonPress and self.group_edit_mode:
+        if etype == QEvent.Type.MouseButtonPress and self.group_edit_mode:
             # Get the widget that was clicked
             click_pos = event.globalPosition().toPoint()
 
@@ -1884,7 +2000,6 @@ class MainWindowV2(QMainWindow):
         self.library_panel.setWindowFlags(Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.NoDropShadowWindowHint)
         self.library_panel.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.library_panel.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, False)  # Allow activation for input method
-        self.library_panel.setStyleSheet("QFrame#libraryPanel { background: transparent; border: none; }")
         self.library_panel.installEventFilter(self)  # Track hide events
         self.library_panel_layout = QVBoxLayout(self.library_panel)
         self.library_panel_layout.setContentsMargins(0, 4, 0, 4)
@@ -2094,7 +2209,6 @@ class MainWindowV2(QMainWindow):
         self.select_all_btn.setObjectName("selectAllBtn")
         self.select_all_btn.setFixedSize(20, 20)
         self.select_all_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.select_all_btn.setStyleSheet("QToolButton { background: transparent; border: none; }")
         self.select_all_btn.clicked.connect(self._on_select_all_btn_clicked)
         batch_layout.addWidget(self.select_all_btn)
 
@@ -2159,21 +2273,26 @@ class MainWindowV2(QMainWindow):
         self.account_list_layout.addStretch()
 
         self.card_view_scroll.setWidget(self.account_list_widget)
+        self.card_view_scroll.verticalScrollBar().valueChanged.connect(self._on_card_scroll)
         list_layout.addWidget(self.card_view_scroll, 1)
 
         # Table view (List View) with bounce effect
-        self.table_view = BounceTableWidget()
+        self.table_view = BounceTableView()
         self.table_view.setObjectName("accountTable")
-        self.table_view.setColumnCount(8)
+        self.table_model = AccountTableModel(
+            self._table_field_texts, self._table_code_text, self.totp_service.code_at, self.table_view
+        )
+        self.table_view.setModel(self.table_model)
+        self.table_view.setItemDelegateForColumn(AccountTableModel.GROUPS_COLUMN, GroupTagDelegate(self.table_view))
         self.table_view.setShowGrid(False)
         self.table_view.setAlternatingRowColors(False)
         self.table_view.setFrameShape(QFrame.Shape.NoFrame)
         self.table_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table_view.setIconSize(QSize(14, 14))
         self.table_view.verticalHeader().setVisible(False)
-        self.table_view.verticalHeader().setDefaultSectionSize(36)
         self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table_view.cellClicked.connect(self._on_table_cell_clicked)
+        self.table_view.clicked.connect(lambda index: self._on_table_cell_clicked(index.row(), index.column()))
         self.table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table_view.customContextMenuRequested.connect(self._on_table_context_menu)
         self.selected_table_row = -1  # Track selected row in table view
@@ -2197,8 +2316,10 @@ class MainWindowV2(QMainWindow):
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.Fixed)  # Notes
         self.table_view.setColumnWidth(7, 120)
 
-        # Set row height
+        # Fixed single-line rows: no per-row size hints or wrapped text layout
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table_view.verticalHeader().setDefaultSectionSize(36)
+        self.table_view.setWordWrap(False)
 
         self.table_view.hide()  # Initially hidden (card view is default)
         list_layout.addWidget(self.table_view, 1)
@@ -2227,6 +2348,7 @@ class MainWindowV2(QMainWindow):
         self.detail_scroll.setWidgetResizable(True)
         self.detail_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.detail_scroll.setFrameShape(QFrame.Shape.NoFrame)
+        self.detail_scroll.viewport().setObjectName("detailScrollViewport")
         # Scroll area background will be set in _apply_theme for proper dark mode support
 
         # Scroll container widget - transparent to inherit parent background
@@ -2407,6 +2529,10 @@ class MainWindowV2(QMainWindow):
         bottom_btn_bg = t.bg_tertiary if is_dark else t.bg_primary
         bottom_btn_hover = "#4B5563" if is_dark else t.bg_hover
 
+        # Card group tags: dark mode = same gray as library button, light mode = translucent gray
+        tag_bg = "#9CA3AF" if is_dark else "rgba(120, 120, 128, 0.16)"
+        tag_fg = t.bg_primary if is_dark else t.text_primary
+
         # Green selection color
         selection_bg = "#065F46" if is_dark else "#10B981"
         selection_color = "#FFFFFF"
@@ -2456,9 +2582,8 @@ class MainWindowV2(QMainWindow):
             }}
 
             #libraryPanel {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-radius: 8px;
+                background: transparent;
+                border: none;
             }}
 
             .libraryCard {{
@@ -2593,6 +2718,10 @@ class MainWindowV2(QMainWindow):
                 background-color: {t.bg_secondary};
                 border-top: 1px solid {t.border};
             }}
+            #selectAllBtn {{
+                background: transparent;
+                border: none;
+            }}
             #batchSelectLabel {{
                 font-size: 12px;
                 color: {t.text_secondary};
@@ -2645,6 +2774,48 @@ class MainWindowV2(QMainWindow):
                 background-color: {t.bg_primary};
             }}
 
+            /* Account cards (the state rules follow :hover so they win over it) */
+            #accountCard {{
+                background-color: transparent;
+            }}
+            #accountCard:hover {{
+                background-color: {t.bg_hover};
+            }}
+            #accountCard[cardState="current"] {{
+                background-color: {t.bg_hover};
+            }}
+            #accountCard[cardState="checked"] {{
+                background-color: {t.border};
+            }}
+            #accountSeparator {{
+                background-color: {t.border};
+            }}
+            #accountCheck {{
+                background: transparent;
+            }}
+            #accountId {{
+                font-size: 11px;
+                color: {t.text_tertiary};
+            }}
+            #accountEmail {{
+                font-size: 13px;
+                font-weight: 500;
+                color: {t.text_primary};
+            }}
+            #accountEmailCompact {{
+                font-size: 12px;
+                color: {t.text_primary};
+            }}
+            #accountTag {{
+                background-color: {tag_bg};
+                color: {tag_fg};
+                padding: 2px 6px;
+                border: none;
+                border-radius: 4px;
+                font-size: 10px;
+                font-weight: 500;
+            }}
+
             /* Table View */
             #accountTable {{
                 background-color: {t.bg_primary};
@@ -2666,6 +2837,13 @@ class MainWindowV2(QMainWindow):
             #detailPanel {{
                 background-color: {t.bg_primary};
             }}
+            #detailScroll {{
+                background-color: {t.bg_primary};
+                border: none;
+            }}
+            #detailScrollViewport {{
+                background-color: {t.bg_primary};
+            }}
 
             #emptyState {{
                 font-size: 14px;
@@ -2841,10 +3019,6 @@ class MainWindowV2(QMainWindow):
             }}
         """)
 
-        # Ensure detail scroll area uses theme background color for dark mode
-        self.detail_scroll.setStyleSheet(f"QScrollArea {{ background-color: {t.bg_primary}; border: none; }}")
-        self.detail_scroll.viewport().setStyleSheet(f"background-color: {t.bg_primary};")
-
         self._update_icons()
         self._update_ui_text()
 
@@ -3366,11 +3540,35 @@ class MainWindowV2(QMainWindow):
     def _show_delete_confirmation(self, message: str) -> bool:
         """Show styled delete confirmation dialog matching library panel colors.
 
+        The dialog is built once per theme/language and reused. Deletions go to
+        the trash with undo, so the user may skip the prompt for the session.
+
         Returns True if user confirms, False otherwise.
         """
-        t = get_theme()
+        if self._skip_delete_confirm:
+            return True
+
+        dialog, label, skip_check = self._get_delete_confirmation_dialog()
+        label.setText(message)
+        skip_check.setChecked(False)
+
+        accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        if accepted and skip_check.isChecked():
+            self._skip_delete_confirm = True
+        return accepted
+
+    def _get_delete_confirmation_dialog(self) -> tuple:
+        """Get the cached (dialog, message label, skip checkbox), rebuilding on theme/language change."""
         is_dark = get_theme_manager().is_dark
         zh = self.state.language == 'zh'
+        key = (is_dark, zh)
+        if self._delete_confirm_dialog is not None and self._delete_confirm_dialog[0] == key:
+            return self._delete_confirm_dialog[1:]
+
+        if self._delete_confirm_dialog is not None:
+            self._delete_confirm_dialog[1].deleteLater()
+
+        t = get_theme()
 
         # Dark mode: use colors matching library panel (softer grays)
         # Light mode: use standard theme colors
@@ -3389,7 +3587,7 @@ class MainWindowV2(QMainWindow):
                 background-color: {dialog_bg};
                 border-radius: 8px;
             }}
-            QLabel {{
+            QLabel, QCheckBox {{
                 color: {text_color};
                 font-size: 13px;
             }}
@@ -3405,10 +3603,13 @@ class MainWindowV2(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
 
-        label = QLabel(message)
+        label = QLabel()
         label.setWordWrap(True)
         layout.addWidget(label)
 
+        skip_check = QCheckBox("本次不再询问" if zh else "Don't ask again this session")
+        layout.addWidget(skip_check)
+
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(8)
 
@@ -3442,7 +3643,8 @@ class MainWindowV2(QMainWindow):
 
         layout.addLayout(btn_layout)
 
-        return dialog.exec() == QDialog.DialogCode.Accepted
+        self._delete_confirm_dialog = (key, dialog, label, skip_check)
+        return dialog, label, skip_check
 
     def _confirm_delete_library(self, lib) -> None:
         """Show styled delete confirmation."""
@@ -3539,10 +3741,12 @@ class MainWindowV2(QMainWindow):
 
     def _switch_library(self, library_id: str) -> None:
         """Switch to a different library."""
-        # Exit multi-select mode when switching libraries
-        self._exit_multi_select_mode()
+        # Exit multi-select mode when switching libraries; the new
+        # library's list is built below, so don't rebuild the old one
+        self._exit_multi_select_mode(refresh=False)
 
-        self._save_data()
+        # Write pending changes to the library being left before swapping state
+        self._flush_save()
         new_lib = self.library_service.switch_library(library_id)
         self.state = self.library_service.load_library_state(new_lib)
         self._update_icons()
@@ -3695,10 +3899,7 @@ class MainWindowV2(QMainWindow):
 
             # Editable group items
             for i, group in enumerate(self.state.groups):
-                item = EditableGroupItem(group, is_dark=is_dark)
-                item.deleted.connect(self._on_group_deleted)
-                item.name_changed.connect(self._on_group_renamed)
-                item.dropped.connect(self._on_group_reorder)
+                item = self._create_editable_group_item(group, is_dark)
                 self.groups_layout.insertWidget(i + 1, item)
                 self.group_buttons.append(item)
 
@@ -3718,27 +3919,39 @@ class MainWindowV2(QMainWindow):
             self.groups_layout.insertWidget(0, all_btn)
             self.group_buttons.append(all_btn)
 
+            # Member counts for every group in one pass over the accounts
+            group_counts = Counter(name for a in self.state.accounts for name in a.groups)
+
             # User groups (with colored dots)
             for i, group in enumerate(self.state.groups):
-                count = len([a for a in self.state.accounts if group.name in a.groups])
+                count = group_counts[group.name]
                 color = group.get_color_for_theme(is_dark)
                 btn = GroupButton(group.name, count, color_hex=color)
                 btn.setProperty("group_id", group.name)
-                btn.clicked.connect(lambda gid=group.name: self._on_group_clicked(gid))
-                btn.rightClicked.connect(lambda pos, gname=group.name: self._on_group_right_clicked(gname, pos))
+                btn.clicked.connect(partial(self._on_group_clicked, group.name))
+                btn.rightClicked.connect(partial(self._on_group_right_clicked, group.name))
                 self.groups_layout.insertWidget(i + 1, btn)
                 self.group_buttons.append(btn)
 
             self._highlight_selected_group()
 
+    def _create_editable_group_item(self, group: Group, is_dark: bool) -> 'EditableGroupItem':
+        """Create an edit-mode group row wired to the rename/delete/reorder handlers."""
+        item = EditableGroupItem(group, is_dark=is_dark)
+        item.deleted.connect(self._on_group_deleted)
+        item.name_changed.connect(self._on_group_renamed)
+        item.dropped.connect(self._on_group_reorder)
+        return item
+
     def _on_group_deleted(self, group_name: str) -> None:
         """Handle group deletion with confirmation and undo."""
         zh = self.state.language == 'zh'
         t = get_theme()
         is_dark = get_theme_manager().is_dark
 
-        # Count accounts using this group
-        count = sum(1 for acc in self.state.accounts if group_name in acc.groups)
+        # Accounts using this group; counted for the dialog, updated on delete
+        members = [acc for acc in self.state.accounts if group_name in acc.groups]
+        count = len(members)
 
         # Create styled confirmation dialog
         dialog = QDialog(self)
@@ -3816,16 +4029,17 @@ class MainWindowV2(QMainWindow):
             return
 
         # Backup for undo
-        deleted_group = next((g for g in self.state.groups if g.name == group_name), None)
-        affected_accounts = [(acc.id, list(acc.groups)) for acc in self.state.accounts if group_name in acc.groups]
-        group_index = next((i for i, g in enumerate(self.state.groups) if g.name == group_name), 0)
+        group_index, deleted_group = next(
+            ((i, g) for i, g in enumerate(self.state.groups) if g.name == group_name), (0, None)
+        )
 
         # Remove group from state
         self.state.groups = [g for g in self.state.groups if g.name != group_name]
-        # Remove group from all accounts
-        for account in self.state.accounts:
-            if group_name in account.groups:
-                account.groups.remove(group_name)
+        # Remove group from all accounts, keeping their old groups for undo
+        affected_accounts = []
+        for account in members:
+            affected_accounts.append((account.id, list(account.groups)))
+            account.groups.remove(group_name)
         # Reset selection if deleted group was selected
         if self.selected_group == group_name:
             self.selected_group = None
@@ -3837,9 +4051,10 @@ class MainWindowV2(QMainWindow):
             if deleted_group:
                 # Restore group at original position
                 self.state.groups.insert(group_index, deleted_group)
-                # Restore group to affected accounts
+                # Restore group to affected accounts (one id index, not a scan per account)
+                by_id = {a.id: a for a in self.state.accounts}
                 for acc_id, original_groups in affected_accounts:
-                    acc = next((a for a in self.state.accounts if a.id == acc_id), None)
+                    acc = by_id.get(acc_id)
                     if acc:
                         acc.groups = original_groups
                 self._refresh_groups()
@@ -3867,11 +4082,11 @@ class MainWindowV2(QMainWindow):
                 group.name = new_name
                 break
 
-        # Update all accounts
+        # Update all accounts (in place, so the tag keeps its position)
         for account in self.state.accounts:
-            if old_name in account.groups:
-                account.groups.remove(old_name)
-                account.groups.append(new_name)
+            groups = account.groups
+            if old_name in groups:
+                groups[groups.index(old_name)] = new_name
 
         # Update selection if renamed group was selected
         if self.selected_group == old_name:
@@ -3902,7 +4117,13 @@ class MainWindowV2(QMainWindow):
                 insert_idx = target_idx + 1
 
             self.state.groups.insert(insert_idx, group)
-            self._refresh_groups()
+
+            # Move the dragged row instead of rebuilding every row; layout
+            # and group_buttons both hold "All Accounts" at index 0
+            self.groups_layout.removeWidget(dragged_item)
+            self.groups_layout.insertWidget(insert_idx + 1, dragged_item)
+            self.group_buttons.remove(dragged_item)
+            self.group_buttons.insert(insert_idx + 1, dragged_item)
 
     def _on_add_group(self) -> None:
         """Add a new group with inline editing."""
@@ -3911,7 +4132,11 @@ class MainWindowV2(QMainWindow):
         # Create group with empty name placeholder
         new_group = Group(name="", color="blue")
         self.state.groups.append(new_group)
-        self._refresh_groups()
+
+        # Append one row just above the "Add Group" button
+        item = self._create_editable_group_item(new_group, get_theme_manager().is_dark)
+        self.groups_layout.insertWidget(len(self.state.groups), item)
+        self.group_buttons.insert(len(self.group_buttons) - 1, item)
 
         # Find the new group's input and focus it after a short delay
         def focus_new_input():
@@ -4005,6 +4230,7 @@ class MainWindowV2(QMainWindow):
         delete_action.triggered.connect(lambda: self._on_group_deleted(group_name))
 
         menu.exec(pos)
+        menu.deleteLater()
 
     def _rename_group(self, old_name: str) -> None:
         """Rename a group."""
@@ -4031,22 +4257,41 @@ class MainWindowV2(QMainWindow):
                     group.name = new_name
                     break
 
-            # Update accounts that use this group
+            # Update accounts that use this group (in place, so the tag keeps its position)
             for account in self.state.accounts:
-                if old_name in account.groups:
-                    account.groups.remove(old_name)
-                    account.groups.append(new_name)
+                groups = account.groups
+                if old_name in groups:
+                    groups[groups.index(old_name)] = new_name
 
             # Update selected group if needed
-            if self.selected_group == old_name:
+            renamed_selected = self.selected_group == old_name
+            if renamed_selected:
                 self.selected_group = new_name
 
             self._save_data()
             self._refresh_groups()
-            self._refresh_account_list()
+            if renamed_selected or self.search_input.text().strip():
+                # The list title or the search matches may change: rebuild
+                self._refresh_account_list()
+            else:
+                self._rename_listed_tags(old_name, new_name)
             self._update_detail_panel()
             self.toast.show_message(f"已重命名为「{new_name}」" if zh else f"Renamed to '{new_name}'")
 
+    def _rename_listed_tags(self, old_name: str, new_name: str) -> None:
+        """Show a renamed group on the listed accounts without rebuilding the list."""
+        if self.list_view_mode:
+            # The groups column reads account.groups when painted
+            self.table_model.refresh_groups()
+            return
+        for widget in self.account_widgets:
+            tags = [tag for tag in widget.findChildren(QLabel, "accountTag") if tag.text() == old_name]
+            for tag in tags:
+                tag.setText(new_name)
+            if tags:
+                # Re-wrap the card's tags for the new width
+                tags[0].parentWidget().layout().apply_layout(CARD_TAGS_WIDTH)
+
     def _move_group(self, group_name: str, direction: int) -> None:
         """Move a group up or down in the list."""
         group_index = next((i for i, g in enumerate(self.state.groups) if g.name == group_name), -1)
@@ -4061,6 +4306,10 @@ class MainWindowV2(QMainWindow):
             self._save_data()
             self._refresh_groups()
 
+    def _shown_accounts(self) -> List[Account]:
+        """Get the accounts the current view lists, as of its last refresh."""
+        return self._table_accounts if self.list_view_mode else self._card_accounts
+
     def _get_filtered_accounts(self) -> List[Account]:
         """Get accounts filtered by current group and search."""
         accounts = self.state.accounts
@@ -4071,29 +4320,8 @@ class MainWindowV2(QMainWindow):
         search_text = self.search_input.text().strip() if hasattr(self, 'search_input') else ""
         if search_text:
             s = search_text.lower()
-            def match_account(a):
-                # Search in email
-                if s in a.email.lower():
-                    return True
-                # Search in password
-                if a.password and s in a.password.lower():
-                    return True
-                # Search in backup email
-                backup = getattr(a, 'backup', '') or getattr(a, 'backup_email', '') or ''
-                if backup and s in backup.lower():
-                    return True
-                # Search in 2FA secret
-                if a.secret and s in a.secret.lower():
-                    return True
-                # Search in notes
-                if a.notes and s in a.notes.lower():
-                    return True
-                # Search in groups
-                for group in a.groups:
-                    if s in group.lower():
-                        return True
-                return False
-            accounts = [a for a in accounts if match_account(a)]
+            # Email, password, backup, secret, notes and groups, lowercased once per account
+            accounts = [a for a in accounts if s in a.search_text]
 
         return accounts
 
@@ -4119,47 +4347,41 @@ class MainWindowV2(QMainWindow):
             accounts = [a for a in accounts if self.selected_group in a.groups]
         if search_text:
             s = search_text.lower()
-            def match_account(a):
-                # Search in email
-                if s in a.email.lower():
-                    return True
-                # Search in password
-                if a.password and s in a.password.lower():
-                    return True
-                # Search in backup email
-                backup = getattr(a, 'backup', '') or getattr(a, 'backup_email', '') or ''
-                if backup and s in backup.lower():
-                    return True
-                # Search in 2FA secret
-                if a.secret and s in a.secret.lower():
-                    return True
-                # Search in notes
-                if a.notes and s in a.notes.lower():
-                    return True
-                # Search in groups
-                for group in a.groups:
-                    if s in group.lower():
-                        return True
-                return False
-            accounts = [a for a in accounts if match_account(a)]
+            # Email, password, backup, secret, notes and groups, lowercased once per account
+            accounts = [a for a in accounts if s in a.search_text]
+        # Own copy, so a single delete can drop its card in place
+        self._card_accounts = list(accounts)
 
         # Clear selection if list is empty (empty category)
         if not accounts:
             self.selected_account = None
             self._update_detail_panel()
 
+        self._update_list_title(len(accounts))
+
+        # Only the first batch is built now; the rest follow on scroll
+        self._append_account_cards()
+
+    def _update_list_title(self, count: int) -> None:
+        """Show the selected group's name and the number of listed accounts."""
         zh = self.state.language == 'zh'
         group_name = self.selected_group or ("全部账户" if zh else "All Accounts")
         count_text = "个账户" if zh else " accounts"
-        self.list_title.setText(f"{group_name} · {len(accounts)}{count_text}")
+        self.list_title.setText(f"{group_name} · {count}{count_text}")
 
+    def _append_account_cards(self) -> None:
+        """Build the next batch of account cards for the listed accounts."""
+        start = len(self.account_widgets)
+        batch = self._card_accounts[start:start + CARD_BATCH_SIZE]
+        if not batch:
+            return
         t = get_theme()
-        for i, account in enumerate(accounts):
+        for i, account in enumerate(batch, start):
             # Add separator before item (except first)
             if i > 0:
                 separator = QFrame()
+                separator.setObjectName("accountSeparator")
                 separator.setFixedHeight(1)
-                separator.setStyleSheet(f"background-color: {t.border};")
                 self.account_list_layout.insertWidget(self.account_list_layout.count() - 1, separator)
 
             item = self._create_account_item(account, t, i)
@@ -4168,16 +4390,26 @@ class MainWindowV2(QMainWindow):
 
         self._highlight_selected_account()
 
+    def _on_card_scroll(self, value: int) -> None:
+        """Build more account cards as the list is scrolled near its end."""
+        if self.list_view_mode or len(self.account_widgets) >= len(self._card_accounts):
+            return
+        scrollbar = self.card_view_scroll.verticalScrollBar()
+        if value >= scrollbar.maximum() - self.card_view_scroll.viewport().height():
+            self._append_account_cards()
+
     def _create_account_item(self, account: Account, t, index: int) -> ClickableFrame:
         """Create account list item widget."""
+        # Styled by the window stylesheet (#accountCard and its cardState property)
         item = ClickableFrame()
+        item.setObjectName("accountCard")
         item.setProperty("account", account)
         item.setProperty("account_index", index)
         item.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # Connect signals with lambda using default args to capture values
-        item.clicked.connect(lambda acc=account, idx=index: self._on_account_clicked(acc, idx))
-        item.rightClicked.connect(lambda pos, acc=account: self._show_account_context_menu(pos, acc))
+        # Shared slots read the account from the sender, so no closure per card
+        item.clicked.connect(self._on_card_clicked)
+        item.rightClicked.connect(self._on_card_right_clicked)
 
         if self.list_view_mode:
             # List view: compact single row - just checkbox, ID, email
@@ -4189,31 +4421,22 @@ class MainWindowV2(QMainWindow):
             if self.multi_select_mode:
                 is_checked = self.selection_manager.is_selected(account)
                 check_label = QLabel()
+                check_label.setObjectName("accountCheck")
                 check_label.setFixedSize(20, 20)
                 check_label.setPixmap(icon_checkbox(16, t.text_secondary) if is_checked else icon_checkbox_empty(16, t.text_tertiary))
-                check_label.setStyleSheet("QLabel { background: transparent; }")
                 check_label.setProperty("account", account)
                 check_label.setProperty("is_checkbox", True)
                 layout.addWidget(check_label)
 
             # ID number
             id_label = QLabel(f"#{index + 1}")
+            id_label.setObjectName("accountId")
             id_label.setFixedWidth(32)
-            id_label.setStyleSheet(f"font-size: 11px; color: {t.text_tertiary};")
             layout.addWidget(id_label)
 
             # Email only
-            if self.codes_visible:
-                email_text = account.email
-            else:
-                if '@' in account.email:
-                    local, domain = account.email.split('@', 1)
-                    email_text = f"{local[:3]}***@{domain}" if len(local) > 3 else f"{local}***@{domain}"
-                else:
-                    email_text = f"{account.email[:3]}***" if len(account.email) > 3 else account.email
-
-            email_label = QLabel(email_text)
-            email_label.setStyleSheet(f"font-size: 12px; color: {t.text_primary};")
+            email_label = QLabel(self._card_email_text(account.email, self.codes_visible))
+            email_label.setObjectName("accountEmailCompact")
             layout.addWidget(email_label, 1)
 
         else:
@@ -4231,9 +4454,9 @@ class MainWindowV2(QMainWindow):
             if self.multi_select_mode:
                 is_checked = self.selection_manager.is_selected(account)
                 check_label = QLabel()
+                check_label.setObjectName("accountCheck")
                 check_label.setFixedSize(20, 20)
                 check_label.setPixmap(icon_checkbox(16, t.text_secondary) if is_checked else icon_checkbox_empty(16, t.text_tertiary))
-                check_label.setStyleSheet("QLabel { background: transparent; }")
                 check_label.setProperty("account", account)
                 check_label.setProperty("is_checkbox", True)
                 top_row.addWidget(check_label)
@@ -4241,22 +4464,13 @@ class MainWindowV2(QMainWindow):
 
             # ID number - fixed width for consistent tag alignment
             id_label = QLabel(f"#{index + 1}")
+            id_label.setObjectName("accountId")
             id_label.setFixedWidth(28)
-            id_label.setStyleSheet(f"font-size: 11px; color: {t.text_tertiary};")
             top_row.addWidget(id_label)
 
             # Email
-            if self.codes_visible:
-                email_text = account.email
-            else:
-                if '@' in account.email:
-                    local, domain = account.email.split('@', 1)
-                    email_text = f"{local[:3]}***@{domain}" if len(local) > 3 else f"{local}***@{domain}"
-                else:
-                    email_text = f"{account.email[:3]}***" if len(account.email) > 3 else account.email
-
-            email_label = QLabel(email_text)
-            email_label.setStyleSheet(f"font-size: 13px; font-weight: 500; color: {t.text_primary};")
+            email_label = QLabel(self._card_email_text(account.email, self.codes_visible))
+            email_label.setObjectName("accountEmail")
             top_row.addWidget(email_label, 1)
 
             layout.addLayout(top_row)
@@ -4269,65 +4483,70 @@ class MainWindowV2(QMainWindow):
                 tags_wrapper.setSpacing(0)
 
                 tags_container = QWidget()
-                is_dark = get_theme_manager().is_dark
                 tags_flow = FlowLayout(spacing=4)
 
-                # Tags with inset effect in dark mode
-                tag_fg = t.text_primary
-
                 for group_name in account.groups:
                     tag = QLabel(group_name)
-                    if is_dark:
-                        # Same gray color as library button
-                        tag.setStyleSheet(f"""
-                            background-color: #9CA3AF;
-                            color: {t.bg_primary};
-                            padding: 2px 6px;
-                            border: none;
-                            border-radius: 4px;
-                            font-size: 10px;
-                            font-weight: 500;
-                        """)
-                    else:
-                        tag.setStyleSheet(f"""
-                            background-color: rgba(120, 120, 128, 0.16);
-                            color: {tag_fg};
-                            padding: 2px 6px;
-                            border: none;
-                            border-radius: 4px;
-                            font-size: 10px;
-                            font-weight: 500;
-                        """)
+                    tag.setObjectName("accountTag")
                     tags_flow.addWidget(tag)
 
-                tags_flow.apply_layout(250)  # 320 - 24 margins - 36 tag indent - scrollbar
+                tags_flow.apply_layout(CARD_TAGS_WIDTH)
                 tags_container.setLayout(tags_flow)
                 tags_wrapper.addWidget(tags_container)
                 tags_wrapper.addStretch()
                 layout.addLayout(tags_wrapper)
 
-        # Apply selection style in multi-select mode
+        # Checked cards in multi-select mode get a more visible gray background
         is_selected = self.multi_select_mode and self.selection_manager.is_selected(account)
-        if is_selected:
-            # Selected style - more visible gray background
-            item.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {t.border};
-                }}
-            """)
-        else:
-            # Normal style
-            item.setStyleSheet(f"""
-                QFrame {{
-                    background-color: transparent;
-                }}
-                QFrame:hover {{
-                    background-color: {t.bg_hover};
-                }}
-            """)
+        item.setProperty("cardState", "checked" if is_selected else "")
 
         return item
 
+    def _on_card_clicked(self) -> None:
+        """Handle a click on an account card."""
+        card = self.sender()
+        self._on_account_clicked(card.property("account"), card.property("account_index"))
+
+    def _on_card_right_clicked(self, pos) -> None:
+        """Show the context menu of a right-clicked account card."""
+        self._show_account_context_menu(pos, self.sender().property("account"))
+
+    @staticmethod
+    def _card_email_text(email: str, visible: bool) -> str:
+        """Get an account card's email text, full or masked."""
+        if visible:
+            return email
+        local, at, domain = email.partition('@')
+        if at:
+            return f"{local[:3]}***@{domain}"
+        return f"{email[:3]}***" if len(email) > 3 else email
+
+    def _update_card_texts(self) -> None:
+        """Re-render account card emails in place (e.g. after a visibility toggle)."""
+        visible = self.codes_visible
+        self.account_list_widget.setUpdatesEnabled(False)
+        try:
+            for widget in self.account_widgets:
+                label = (widget.findChild(QLabel, "accountEmail")
+                         or widget.findChild(QLabel, "accountEmailCompact"))
+                if label is not None:
+                    label.setText(self._card_email_text(widget.property("account").email, visible))
+        finally:
+            self.account_list_widget.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _set_card_state(widget: QWidget, state: str) -> None:
+        """Set an account card's cardState ("", "current" or "checked") and restyle it."""
+        # Re-polishing is the costly part; skip cards already in this state
+        if widget.property("cardState") == state:
+            return
+        widget.setProperty("cardState", state)
+        # Re-polish so the window stylesheet's [cardState=...] rules re-match
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
     def _on_account_clicked(self, account: Account, index: int = -1) -> None:
         """Handle account selection with Excel-style modifier key support."""
         if self.multi_select_mode:
@@ -4335,15 +4554,12 @@ class MainWindowV2(QMainWindow):
             modifiers = QApplication.keyboardModifiers()
             shift_held = bool(modifiers & Qt.KeyboardModifier.ShiftModifier)
 
-            # Get filtered accounts list for range selection
-            filtered = self._get_filtered_accounts()
+            # Range selection runs over the accounts currently listed
+            filtered = self._shown_accounts()
 
             # Use SelectionManager to handle the click
             self.selection_manager.handle_click(account, index, filtered, shift_held)
-
-            # Update visual state without recreating widgets
-            self._update_selection_visuals()
-            self._update_batch_bar()
+            self._selection_timer.start()
             return
 
         # Normal mode: select account
@@ -4391,7 +4607,7 @@ class MainWindowV2(QMainWindow):
 
             for group in self.state.groups:
                 action = add_menu.addAction(f"■ {group.name}")
-                action.triggered.connect(lambda checked, g=group.name: self._batch_add_to_group(g))
+                action.triggered.connect(partial(self._batch_add_to_group, group.name))
 
             if self.state.groups:
                 add_menu.addSeparator()
@@ -4411,7 +4627,7 @@ class MainWindowV2(QMainWindow):
 
                 for group_name in sorted(groups_in_selection):
                     action = remove_menu.addAction(f"■ {group_name}")
-                    action.triggered.connect(lambda checked, g=group_name: self._batch_remove_from_group(g))
+                    action.triggered.connect(partial(self._batch_remove_from_group, group_name))
 
             menu.addSeparator()
 
@@ -4434,9 +4650,9 @@ class MainWindowV2(QMainWindow):
                     lib_submenu = move_lib_menu.addMenu(QIcon(icon_library(14, ic)), lib.name)
                     lib_submenu.setStyleSheet(menu_style)
                     move_action = lib_submenu.addAction("移动" if zh else "Move")
-                    move_action.triggered.connect(lambda checked, l=lib: self._batch_move_to_library(l, remove_from_current=True))
+                    move_action.triggered.connect(partial(self._batch_move_to_library, lib, remove_from_current=True))
                     copy_action = lib_submenu.addAction("复制" if zh else "Copy")
-                    copy_action.triggered.connect(lambda checked, l=lib: self._batch_move_to_library(l, remove_from_current=False))
+                    copy_action.triggered.connect(partial(self._batch_move_to_library, lib, remove_from_current=False))
 
             menu.addSeparator()
 
@@ -4466,7 +4682,7 @@ class MainWindowV2(QMainWindow):
 
             for group in self.state.groups:
                 action = add_menu.addAction(f"■ {group.name}")
-                action.triggered.connect(lambda checked, g=group.name, a=account: self._add_account_to_group(a, g))
+                action.triggered.connect(partial(self._add_account_to_group, account, group.name))
 
             if self.state.groups:
                 add_menu.addSeparator()
@@ -4481,7 +4697,7 @@ class MainWindowV2(QMainWindow):
 
                 for group_name in account.groups:
                     action = remove_menu.addAction(f"■ {group_name}")
-                    action.triggered.connect(lambda checked, g=group_name, a=account: self._remove_account_from_group(a, g))
+                    action.triggered.connect(partial(self._remove_account_from_group, account, group_name))
 
             # Move to library submenu
             from ..services.library_service import get_library_service
@@ -4498,9 +4714,9 @@ class MainWindowV2(QMainWindow):
                     lib_submenu = move_lib_menu.addMenu(QIcon(icon_library(14, ic)), lib.name)
                     lib_submenu.setStyleSheet(menu_style)
                     move_action = lib_submenu.addAction("移动" if zh else "Move")
-                    move_action.triggered.connect(lambda checked, l=lib, a=account: self._move_account_to_library(a, l, remove_from_current=True))
+                    move_action.triggered.connect(partial(self._move_account_to_library, account, lib, remove_from_current=True))
                     copy_action = lib_submenu.addAction("复制" if zh else "Copy")
-                    copy_action.triggered.connect(lambda checked, l=lib, a=account: self._move_account_to_library(a, l, remove_from_current=False))
+                    copy_action.triggered.connect(partial(self._move_account_to_library, account, lib, remove_from_current=False))
 
             menu.addSeparator()
 
@@ -4509,6 +4725,7 @@ class MainWindowV2(QMainWindow):
             delete_action.triggered.connect(lambda: self._delete_single_account(account))
 
         menu.exec(pos)
+        menu.deleteLater()
 
     def _copy_field(self, value: str, label: str) -> None:
         """Copy a field value to clipboard."""
@@ -4576,25 +4793,25 @@ class MainWindowV2(QMainWindow):
         deleted_account = account
         was_selected = self.selected_account == account
 
-        # Move to trash
+        # Move to trash. Accounts compare by email, so remove this very object
+        # rather than the first account with an equal email.
         if hasattr(self.state, 'trash'):
             self.state.trash.append(account)
-        if account in self.state.accounts:
-            self.state.accounts.remove(account)
+        self.state.accounts[:] = [a for a in self.state.accounts if a is not account]
 
         if was_selected:
             self.selected_account = None
 
         self._save_data()
         self._refresh_groups()
-        self._refresh_account_list()
+        self._remove_listed_account(account)
         self._update_detail_panel()
 
         # Undo callback
         def undo_delete():
             # Restore from trash
-            if hasattr(self.state, 'trash') and deleted_account in self.state.trash:
-                self.state.trash.remove(deleted_account)
+            if hasattr(self.state, 'trash'):
+                self.state.trash[:] = [a for a in self.state.trash if a is not deleted_account]
             self.state.accounts.append(deleted_account)
             if was_selected:
                 self.selected_account = deleted_account
@@ -4612,6 +4829,62 @@ class MainWindowV2(QMainWindow):
             action_callback=undo_delete
         )
 
+    def _remove_listed_account(self, account: Account) -> None:
+        """
+        Drop a deleted account from the shown list without rebuilding it.
+
+        The table removes just that row; in card view the card and its
+        separator are removed and the cards below are renumbered. Falls
+        back to a full refresh when the account is not listed.
+
+        Args:
+            account: The account that was removed from the state.
+        """
+        if self.list_view_mode:
+            if self._table_rows is None:
+                self._table_rows = {id(a): i for i, a in enumerate(self._table_accounts)}
+            row = self._table_rows.get(id(account), -1)
+            if row < 0:
+                self._refresh_account_list()
+                return
+            self._table_rows = None
+            if self.selected_table_row == row:
+                self.selected_table_row = -1
+            elif self.selected_table_row > row:
+                self.selected_table_row -= 1
+            self.table_model.remove_row(row)
+        else:
+            index = next((i for i, a in enumerate(self._card_accounts) if a is account), -1)
+            if index < 0:
+                self._refresh_account_list()
+                return
+            del self._card_accounts[index]
+            if index < len(self.account_widgets):
+                layout = self.account_list_layout
+                card = self.account_widgets.pop(index)
+                pos = layout.indexOf(card)
+                # A separator precedes every card but the first
+                sep_item = layout.itemAt(pos - 1 if pos > 0 else pos + 1)
+                separator = sep_item.widget() if sep_item is not None else None
+                for widget in (card, separator):
+                    if widget is not None and (widget is card or widget.objectName() == "accountSeparator"):
+                        layout.removeWidget(widget)
+                        widget.hide()
+                        widget.setParent(None)
+                        widget.deleteLater()
+                for i in range(index, len(self.account_widgets)):
+                    item = self.account_widgets[i]
+                    item.setProperty("account_index", i)
+                    id_label = item.findChild(QLabel, "accountId")
+                    if id_label is not None:
+                        id_label.setText(f"#{i + 1}")
+            if not self._card_accounts:
+                self.selected_account = None
+            self._update_list_title(len(self._card_accounts))
+        if self.multi_select_mode:
+            self.selection_manager.discard(account)
+            self._update_batch_bar()
+
     def _on_checkbox_changed(self, account: Account, state: int) -> None:
         """Handle checkbox state change in multi-select mode."""
         acc_id = id(account)
@@ -4626,63 +4899,42 @@ class MainWindowV2(QMainWindow):
     def _update_selection_visuals(self) -> None:
         """Update visual state of account cards for multi-select mode without recreating widgets."""
         t = get_theme()
-        for widget in self.account_widgets:
-            account = widget.property("account")
-            is_selected = self.selection_manager.is_selected(account)
-
-            # Update background style
-            if is_selected:
-                widget.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {t.border};
-                    }}
-                """)
-            else:
-                widget.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: transparent;
-                    }}
-                    QFrame:hover {{
-                        background-color: {t.bg_hover};
-                    }}
-                """)
+        # Rendered once per pass; QPixmap copies share the image data
+        checked_icon = icon_checkbox(16, t.text_secondary)
+        unchecked_icon = icon_checkbox_empty(16, t.text_tertiary)
 
-            # Update checkbox icon
-            for child in widget.findChildren(QLabel):
-                if child.property("is_checkbox"):
-                    if is_selected:
-                        child.setPixmap(icon_checkbox(16, t.text_secondary))
-                    else:
-                        child.setPixmap(icon_checkbox_empty(16, t.text_tertiary))
-                    break
+        # One repaint after the whole pass instead of one per card
+        self.account_list_widget.setUpdatesEnabled(False)
+        try:
+            for widget in self.account_widgets:
+                account = widget.property("account")
+                is_selected = self.selection_manager.is_selected(account)
+
+                # Update background style (re-polished only if the state changed)
+                self._set_card_state(widget, "checked" if is_selected else "")
+
+                # Update checkbox icon
+                check_label = widget.findChild(QLabel, "accountCheck")
+                if check_label is not None:
+                    check_label.setPixmap(checked_icon if is_selected else unchecked_icon)
+        finally:
+            self.account_list_widget.setUpdatesEnabled(True)
 
     def _highlight_selected_account(self) -> None:
         """Highlight selected account item."""
-        t = get_theme()
-        for widget in self.account_widgets:
-            account = widget.property("account")
-            # Check multi-select mode first
-            if self.multi_select_mode and self.selection_manager.is_selected(account):
-                widget.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {t.bg_hover};
-                    }}
-                """)
-            elif account == self.selected_account:
-                widget.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {t.bg_hover};
-                    }}
-                """)
-            else:
-                widget.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: transparent;
-                    }}
-                    QFrame:hover {{
-                        background-color: {t.bg_hover};
-                    }}
-                """)
+        self.account_list_widget.setUpdatesEnabled(False)
+        try:
+            for widget in self.account_widgets:
+                account = widget.property("account")
+                # Check multi-select mode first
+                if self.multi_select_mode and self.selection_manager.is_selected(account):
+                    self._set_card_state(widget, "current")
+                elif account == self.selected_account:
+                    self._set_card_state(widget, "current")
+                else:
+                    self._set_card_state(widget, "")
+        finally:
+            self.account_list_widget.setUpdatesEnabled(True)
 
     def _update_detail_panel(self) -> None:
         """Update detail panel with selected account."""
@@ -4692,15 +4944,11 @@ class MainWindowV2(QMainWindow):
             self.empty_container.show()
             self.detail_scroll.hide()
             self.detail_content.hide()
-            # Use primary background when empty
-            self.detail_panel.setStyleSheet(f"#detailPanel {{ background-color: {t.bg_primary}; }}")
             return
 
         self.empty_container.hide()
         self.detail_scroll.show()
         self.detail_content.show()
-        # Use primary background for cleaner look
-        self.detail_panel.setStyleSheet(f"#detailPanel {{ background-color: {t.bg_primary}; }}")
 
         # Handle visibility for header
         if self.codes_visible:
@@ -5051,37 +5299,76 @@ class MainWindowV2(QMainWindow):
 
     def _start_timer(self) -> None:
         """Start TOTP timer."""
+        # Single-shot timer re-armed for the next whole second on every tick, so the
+        # countdown stays aligned with the TOTP period instead of drifting.
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self._update_timer)
-        self.timer.start(1000)
+        self._totp_counter = None
+        self._totp_remaining = None
+        self._update_timer()
 
     def _update_timer(self) -> None:
         """Update TOTP timer."""
-        try:
-            remaining = self.time_service.get_remaining_seconds()
-            self.totp_progress.setValue(remaining)
-            self.totp_timer.setText(f"{remaining}s")
-
-            if remaining >= 29:
-                self._update_totp_display()
-                self._refresh_account_list_codes()
+        # Nothing to show while hidden or minimized; the timer is re-armed on restore
+        if not self.isVisible() or self.isMinimized():
+            return
 
-            if self.selected_account and self.selected_account.secret:
+        now = time.time()
+        try:
+            now = self.time_service.get_accurate_time()
+            period = self.totp_service.period
+            remaining = period - int(now % period)
+            # Only touch the countdown widgets when the displayed second changes
+            # (early/late wakeups and resumes can land in the same second)
+            if remaining != self._totp_remaining:
+                self._totp_remaining = remaining
+                self.totp_progress.setValue(remaining)
+                self.totp_timer.setText(f"{remaining}s")
+
+            # Codes only change when the time step rolls over
+            counter = int(now) // period
+            if counter != self._totp_counter:
+                self._totp_counter = counter
                 self._update_totp_display()
+                self._refresh_account_list_codes(counter)
 
         except Exception as e:
             logger.error(f"Timer error: {e}")
+        finally:
+            self.timer.start(max(1, int((1 - now % 1) * 1000)))
+
+    def _refresh_account_list_codes(self, counter: int) -> None:
+        """
+        Refresh the code column of the table view for a new TOTP time step.
+
+        Args:
+            counter: The new time-step counter, read once by the timer tick.
+        """
+        # Cards no longer show codes; only the table view needs updating
+        if not self.list_view_mode or not self._table_accounts:
+            return
 
-    def _refresh_account_list_codes(self) -> None:
-        """Refresh account list display (handles visibility toggle)."""
-        # Since we removed TOTP from cards, just refresh the list on visibility change
-        pass
+        # One dataChanged() over the code column; only painted rows compute codes
+        self.table_model.refresh_codes(counter)
 
     # === Event Handlers ===
 
     def _on_search_changed(self, text: str) -> None:
-        """Handle search input."""
+        """Handle search input (throttled, see _flush_search)."""
+        if self._search_timer.isActive():
+            self._search_pending = True
+            return
         self._refresh_account_list(text)
+        self._search_timer.start()
+
+    def _flush_search(self) -> None:
+        """Apply the latest search text if it changed during the throttle interval."""
+        if not self._search_pending:
+            return
+        self._search_pending = False
+        self._refresh_account_list(self.search_input.text())
 
     def _toggle_theme(self) -> None:
         """Toggle light/dark theme."""
@@ -5106,10 +5393,11 @@ class MainWindowV2(QMainWindow):
         self.codes_visible = not self.codes_visible
         self._update_icons()
 
+        # Only texts change; keep the existing rows and cards
         if self.list_view_mode:
-            self._refresh_table_view()
+            self._update_table_texts()
         else:
-            self._refresh_account_list()
+            self._update_card_texts()
             self._update_detail_panel()
 
         zh = self.state.language == 'zh'
@@ -5139,25 +5427,50 @@ class MainWindowV2(QMainWindow):
         else:
             self.toast.show_message("已关闭多选" if zh else "Multi-select off")
 
-    def _exit_multi_select_mode(self) -> None:
-        """Exit multi-select mode silently (without toast)."""
+    def _finish_batch_edit(self) -> None:
+        """Refresh the views after a batch edit and leave multi-select mode."""
+        self._refresh_groups()
+        if self.multi_select_mode:
+            # Exiting refreshes the list, batch bar and detail panel itself
+            self._exit_multi_select_mode()
+        else:
+            self._refresh_account_list()
+            self._update_batch_bar()
+            self._update_detail_panel()
+
+    def _exit_multi_select_mode(self, refresh: bool = True) -> None:
+        """
+        Exit multi-select mode silently (without toast).
+
+        Args:
+            refresh: Rebuild the icons, account list and detail panel. Callers
+                that rebuild them right afterwards pass False.
+        """
         if not self.multi_select_mode:
             return
         self.multi_select_mode = False
         self.selection_manager.clear()
-        self._update_icons()
-        self._refresh_account_list()
         self._update_batch_bar()
-        self._update_detail_panel()
+        if refresh:
+            self._update_icons()
+            self._refresh_account_list()
+            self._update_detail_panel()
+
+    def _update_batch_bar(self, total: Optional[int] = None) -> None:
+        """
+        Update batch action bar visibility and label.
 
-    def _update_batch_bar(self) -> None:
-        """Update batch action bar visibility and label."""
+        Args:
+            total: Number of accounts currently listed, if the caller already
+                has it (defaults to the current view's list).
+        """
         self.batch_action_bar.setVisible(self.multi_select_mode)
         if self.multi_select_mode:
             t = get_theme()
             zh = self.state.language == 'zh'
             count = self.selection_manager.count
-            total = len(self._get_filtered_accounts())
+            if total is None:
+                total = len(self._shown_accounts())
 
             # Update select all icon button
             if count == total and total > 0:
@@ -5174,17 +5487,17 @@ class MainWindowV2(QMainWindow):
 
     def _on_select_all_changed(self, state: int) -> None:
         """Handle select all checkbox state change (legacy, kept for compatibility)."""
-        filtered = self._get_filtered_accounts()
+        filtered = self._shown_accounts()
         if state == 2:  # Checked - select all
             self.selection_manager.set_all(filtered)
         else:  # Unchecked - deselect all
             self.selection_manager.clear()
-        self._refresh_account_list()
-        self._update_batch_bar()
+        self._refresh_selection_visuals()
+        self._update_batch_bar(len(filtered))
 
     def _on_select_all_btn_clicked(self) -> None:
         """Handle select all icon button click."""
-        filtered = self._get_filtered_accounts()
+        filtered = self._shown_accounts()
         count = self.selection_manager.count
         total = len(filtered)
 
@@ -5195,9 +5508,23 @@ class MainWindowV2(QMainWindow):
             # Not all selected - select all
             self.selection_manager.set_all(filtered)
 
-        self._refresh_account_list()
+        self._refresh_selection_visuals()
+        self._update_batch_bar(total)
+
+    def _commit_selection_change(self) -> None:
+        """Show the multi-select clicks made since the last pass, in one update."""
+        if not self.multi_select_mode:
+            return  # Leaving the mode already refreshed everything
+        self._refresh_selection_visuals()
         self._update_batch_bar()
 
+    def _refresh_selection_visuals(self) -> None:
+        """Show a changed multi-select selection in place, without rebuilding the list."""
+        if self.list_view_mode:
+            self.table_model.refresh_checks()
+        else:
+            self._update_selection_visuals()
+
     def _handle_notes_click(self) -> None:
         """Handle notes field click to enable editing."""
         try:
@@ -5270,11 +5597,12 @@ class MainWindowV2(QMainWindow):
         was_selected = self.selected_account
         selected_was_deleted = self.selection_manager.is_selected(self.selected_account)
 
-        for account in deleted_accounts:
-            if hasattr(self.state, 'trash'):
-                self.state.trash.append(account)
-            if account in self.state.accounts:
-                self.state.accounts.remove(account)
+        # Rebuild the list once instead of a remove() scan per account;
+        # match by identity, as the selection holds the account objects
+        deleted_ids = {id(account) for account in deleted_accounts}
+        if hasattr(self.state, 'trash'):
+            self.state.trash.extend(deleted_accounts)
+        self.state.accounts[:] = [a for a in self.state.accounts if id(a) not in deleted_ids]
 
         # Clear selected account if it was deleted
         if selected_was_deleted:
@@ -5282,17 +5610,13 @@ class MainWindowV2(QMainWindow):
 
         self.selection_manager.clear()
         self._save_data()
-        self._refresh_groups()
-        self._refresh_account_list()
-        self._update_batch_bar()
-        self._update_detail_panel()
+        self._finish_batch_edit()
 
         # Undo callback
         def undo_delete():
-            for account in deleted_accounts:
-                if hasattr(self.state, 'trash') and account in self.state.trash:
-                    self.state.trash.remove(account)
-                self.state.accounts.append(account)
+            if hasattr(self.state, 'trash'):
+                self.state.trash[:] = [a for a in self.state.trash if id(a) not in deleted_ids]
+            self.state.accounts.extend(deleted_accounts)
             if selected_was_deleted and was_selected:
                 self.selected_account = was_selected
             self._save_data()
@@ -5301,9 +5625,6 @@ class MainWindowV2(QMainWindow):
             self._update_detail_panel()
             self.toast.show_message(f"已恢复 {count} 个账户" if zh else f"Restored {count} accounts")
 
-        # Exit multi-select mode
-        self._exit_multi_select_mode()
-
         # Show toast with undo
         self.toast.show_message(
             f"已删除 {count} 个账户" if zh else f"Deleted {count} accounts",
@@ -5386,7 +5707,7 @@ class MainWindowV2(QMainWindow):
 
         for group in self.state.groups:
             action = menu.addAction(f"■ {group.name}")
-            action.triggered.connect(lambda checked, g=group.name: self._batch_add_to_group(g))
+            action.triggered.connect(partial(self._batch_add_to_group, group.name))
 
         if self.state.groups:
             menu.addSeparator()
@@ -5396,6 +5717,7 @@ class MainWindowV2(QMainWindow):
 
         # Show menu below button
         menu.exec(self.btn_batch_add_group.mapToGlobal(self.btn_batch_add_group.rect().bottomLeft()))
+        menu.deleteLater()
 
     def _show_batch_remove_group_menu(self) -> None:
         """Show menu to remove selected accounts from a group."""
@@ -5444,10 +5766,11 @@ class MainWindowV2(QMainWindow):
 
         for group_name in sorted(groups_in_selection):
             action = menu.addAction(f"■ {group_name}")
-            action.triggered.connect(lambda checked, g=group_name: self._batch_remove_from_group(g))
+            action.triggered.connect(partial(self._batch_remove_from_group, group_name))
 
         # Show menu below button
         menu.exec(self.btn_batch_remove_group.mapToGlobal(self.btn_batch_remove_group.rect().bottomLeft()))
+        menu.deleteLater()
 
     def _show_batch_move_library_menu(self) -> None:
         """Show menu to move/copy selected accounts to another library."""
@@ -5505,14 +5828,15 @@ class MainWindowV2(QMainWindow):
 
             # Move option (remove from current library)
             move_action = lib_menu.addAction("移动" if zh else "Move")
-            move_action.triggered.connect(lambda checked, l=lib: self._batch_move_to_library(l, remove_from_current=True))
+            move_action.triggered.connect(partial(self._batch_move_to_library, lib, remove_from_current=True))
 
             # Copy option (keep in both libraries)
             copy_action = lib_menu.addAction("复制" if zh else "Copy")
-            copy_action.triggered.connect(lambda checked, l=lib: self._batch_move_to_library(l, remove_from_current=False))
+            copy_action.triggered.connect(partial(self._batch_move_to_library, lib, remove_from_current=False))
 
         # Show menu below button
         menu.exec(self.btn_batch_move_library.mapToGlobal(self.btn_batch_move_library.rect().bottomLeft()))
+        menu.deleteLater()
 
     def _batch_move_to_library(self, target_library, remove_from_current: bool = True) -> None:
         """Move or copy selected accounts to another library with undo support."""
@@ -5531,8 +5855,9 @@ class MainWindowV2(QMainWindow):
             # Load target library state
             target_state = library_service.load_library_state(target_library)
 
-            # Get existing group names in target library
+            # Get existing group names in target library, and source groups by name
             target_group_names = {g.name for g in target_state.groups}
+            source_groups = {g.name: g for g in self.state.groups}
 
             # Store for undo
             moved_accounts = []
@@ -5556,7 +5881,7 @@ class MainWindowV2(QMainWindow):
                     for group_name in account_copy.groups:
                         if group_name not in target_group_names:
                             # Find the group color from source library
-                            source_group = next((g for g in self.state.groups if g.name == group_name), None)
+                            source_group = source_groups.get(group_name)
                             color = source_group.color if source_group else "red"
                             target_state.groups.append(Group(name=group_name, color=color))
                             target_group_names.add(group_name)
@@ -5576,10 +5901,7 @@ class MainWindowV2(QMainWindow):
                 self.selection_manager.clear()
 
                 self._save_data()
-                self._refresh_groups()
-                self._refresh_account_list()
-                self._update_batch_bar()
-                self._update_detail_panel()
+                self._finish_batch_edit()
 
                 action_text = "移动" if zh else "Moved"
             else:
@@ -5650,10 +5972,11 @@ class MainWindowV2(QMainWindow):
 
             # Create missing groups in target library
             target_group_names = {g.name for g in target_state.groups}
+            source_groups = {g.name: g for g in self.state.groups}
             for group_name in account_copy.groups:
                 if group_name not in target_group_names:
                     # Find the group color from source library
-                    source_group = next((g for g in self.state.groups if g.name == group_name), None)
+                    source_group = source_groups.get(group_name)
                     color = source_group.color if source_group else "red"
                     target_state.groups.append(Group(name=group_name, color=color))
                     target_group_names.add(group_name)
@@ -5694,12 +6017,7 @@ class MainWindowV2(QMainWindow):
 
         if count > 0:
             self._save_data()
-            self._refresh_account_list()
-            self._update_detail_panel()
-            self._refresh_groups()
-
-            # Exit multi-select mode
-            self._exit_multi_select_mode()
+            self._finish_batch_edit()
 
             zh = self.state.language == 'zh'
             self.toast.show_message(f"已添加 {count} 个账户到「{group_name}」" if zh else f"Added {count} accounts to '{group_name}'")
@@ -5745,12 +6063,7 @@ class MainWindowV2(QMainWindow):
         count = len(affected_accounts)
         if count > 0:
             self._save_data()
-            self._refresh_account_list()
-            self._update_detail_panel()
-            self._refresh_groups()
-
-            # Exit multi-select mode
-            self._exit_multi_select_mode()
+            self._finish_batch_edit()
 
             # Undo callback
             def undo_remove():
@@ -5831,31 +6144,30 @@ class MainWindowV2(QMainWindow):
 
     def _refresh_table_view(self) -> None:
         """Refresh the table view with current accounts."""
-        t = get_theme()
         zh = self.state.language == 'zh'
 
-        # Clear all existing cell widgets to prevent stale signal connections
-        for row in range(self.table_view.rowCount()):
-            for col in range(self.table_view.columnCount()):
-                widget = self.table_view.cellWidget(row, col)
-                if widget:
-                    self.table_view.removeCellWidget(row, col)
-                    widget.deleteLater()
-
         # Set headers based on multi-select mode
-        first_col = "" if self.multi_select_mode else "#"
-        headers = [first_col, "邮箱" if zh else "Email", "密码" if zh else "Password",
-                   "辅助邮箱" if zh else "Backup", "2FA密钥" if zh else "2FA Key",
-                   "验证码" if zh else "Code", "分组" if zh else "Groups",
-                   "备注" if zh else "Notes"]
-        self.table_view.setHorizontalHeaderLabels(headers)
+        headers = list(TABLE_COLUMN_NAMES['zh' if zh else 'en'])
+        if self.multi_select_mode:
+            headers[0] = ""
 
         # Get filtered accounts
         accounts = self._get_filtered_accounts()
-        self.table_view.setRowCount(len(accounts))
 
-        # Store accounts list for reference
-        self._table_accounts = accounts
+        # Store accounts list for reference. It is an own copy: the model
+        # removes deleted rows from it in place.
+        self._table_accounts = list(accounts)
+        self._table_rows = None
+
+        # The model serves cells (and codes) on demand; a reset also drops any inline editor.
+        # The time step is read once here, not per painted code cell.
+        self.table_model.set_accounts(
+            self._table_accounts, self.totp_service.get_counter(), headers,
+            visible=self.codes_visible,
+            selected_row=self.selected_table_row,
+            multi_select=self.multi_select_mode,
+            is_checked=self.selection_manager.is_selected,
+        )
 
         # Adjust first column width based on mode
         if self.multi_select_mode:
@@ -5863,167 +6175,32 @@ class MainWindowV2(QMainWindow):
         else:
             self.table_view.setColumnWidth(0, 50)  # Just ID
 
-        for row, account in enumerate(accounts):
-            # First column: ID (with checkbox in multi-select mode)
-            if self.multi_select_mode:
-                # Checkbox + ID widget
-                first_col_widget = QWidget()
-                first_col_layout = QHBoxLayout(first_col_widget)
-                first_col_layout.setContentsMargins(8, 0, 4, 0)
-                first_col_layout.setSpacing(6)
-                first_col_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-
-                check_btn = QToolButton()
-                check_btn.setFixedSize(18, 18)
-                check_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                is_checked = self.selection_manager.is_selected(account)
-                check_btn.setIcon(QIcon(icon_checkbox(14, t.text_secondary) if is_checked else icon_checkbox_empty(14, t.text_tertiary)))
-                check_btn.setStyleSheet("QToolButton { background: transparent; border: none; }")
-                check_btn.clicked.connect(lambda checked, a=account, r=row: self._on_table_checkbox_clicked(a, r))
-                first_col_layout.addWidget(check_btn)
-
-                id_label = QLabel(f"#{row + 1}")
-                id_label.setStyleSheet(f"color: {t.text_tertiary}; font-size: 12px;")
-                first_col_layout.addWidget(id_label)
-
-                self.table_view.setCellWidget(row, 0, first_col_widget)
-                # Set empty item for background handling
-                id_item = QTableWidgetItem()
-                id_item.setData(Qt.ItemDataRole.UserRole + 1, account)
-                self.table_view.setItem(row, 0, id_item)
-            else:
-                # ID number only
-                self.table_view.removeCellWidget(row, 0)
-                id_item = QTableWidgetItem(f"#{row + 1}")
-                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                id_item.setForeground(QColor(t.text_tertiary))
-                id_item.setData(Qt.ItemDataRole.UserRole + 1, account)
-                self.table_view.setItem(row, 0, id_item)
-
-            # Email column
-            email_display = account.email if self.codes_visible else self._mask_email(account.email)
-            email_item = QTableWidgetItem(email_display)
-            email_item.setData(Qt.ItemDataRole.UserRole, account.email)
-            email_item.setData(Qt.ItemDataRole.UserRole + 1, account)
-            email_item.setForeground(QColor(t.text_primary))
-            self.table_view.setItem(row, 1, email_item)
-
-            # Password column
-            pwd_display = account.password if self.codes_visible else ("••••••••" if account.password else "-")
-            pwd_item = QTableWidgetItem(pwd_display)
-            pwd_item.setData(Qt.ItemDataRole.UserRole, account.password)
-            pwd_item.setForeground(QColor(t.text_secondary))
-            self.table_view.setItem(row, 2, pwd_item)
-
-            # Backup email column
-            backup = getattr(account, 'backup', '') or getattr(account, 'backup_email', '') or ''
-            backup_display = backup if self.codes_visible else (self._mask_email(backup) if backup else "-")
-            backup_item = QTableWidgetItem(backup_display if backup else "-")
-            backup_item.setData(Qt.ItemDataRole.UserRole, backup)
-            backup_item.setForeground(QColor(t.text_secondary))
-            self.table_view.setItem(row, 3, backup_item)
-
-            # 2FA Key column
-            secret_display = account.secret[:8] + "..." if account.secret and self.codes_visible else ("••••••••" if account.secret else "-")
-            secret_item = QTableWidgetItem(secret_display)
-            secret_item.setData(Qt.ItemDataRole.UserRole, account.secret)
-            secret_item.setForeground(QColor(t.text_secondary))
-            self.table_view.setItem(row, 4, secret_item)
-
-            # Code column
-            if account.secret:
-                code = self.totp_service.generate_code_safe(account.secret)
-                code_display = f"{code[:3]} {code[3:]}" if code and len(code) == 6 and self.codes_visible else "*** ***"
-            else:
-                code_display = "-"
-                code = ""
-            code_item = QTableWidgetItem(code_display)
-            code_item.setData(Qt.ItemDataRole.UserRole, code)
-            code_item.setForeground(QColor(t.success if account.secret else t.text_tertiary))
-            self.table_view.setItem(row, 5, code_item)
-
-            # Groups column - display as small tags (same style as card view)
-            is_dark = get_theme_manager().is_dark
-            groups_widget = QWidget()
-            groups_widget.setObjectName(f"groupsWidget_{row}")
-            groups_layout = QHBoxLayout(groups_widget)
-            groups_layout.setContentsMargins(8, 0, 8, 0)
-            groups_layout.setSpacing(4)
-            groups_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+    def _table_field_texts(self, account: Account, visible: bool) -> tuple:
+        """Get the display texts of table columns 1-4 (email..secret), full or masked."""
+        backup = getattr(account, 'backup', '') or getattr(account, 'backup_email', '') or ''
 
-            if account.groups:
-                for group_name in account.groups[:5]:  # Max 5 tags
-                    tag_label = QLabel(group_name)
-                    tag_label.setFixedHeight(18)
-                    if is_dark:
-                        tag_label.setStyleSheet("""
-                            QLabel {
-                                background-color: #9CA3AF;
-                                color: #111827;
-                                padding: 0px 6px;
-                                border: none;
-                                border-radius: 3px;
-                                font-size: 10px;
-                                font-weight: 500;
-                            }
-                        """)
-                    else:
-                        tag_label.setStyleSheet(f"""
-                            QLabel {{
-                                background-color: rgba(120, 120, 128, 0.16);
-                                color: {t.text_primary};
-                                padding: 0px 6px;
-                                border: none;
-                                border-radius: 3px;
-                                font-size: 10px;
-                                font-weight: 500;
-                            }}
-                        """)
-                    groups_layout.addWidget(tag_label)
-                if len(account.groups) > 5:
-                    more_label = QLabel(f"+{len(account.groups) - 5}")
-                    more_label.setFixedHeight(18)
-                    more_label.setStyleSheet(f"color: {t.text_tertiary}; font-size: 10px;")
-                    groups_layout.addWidget(more_label)
-            else:
-                empty_label = QLabel("-")
-                empty_label.setStyleSheet(f"color: {t.text_tertiary};")
-                groups_layout.addWidget(empty_label)
-
-            groups_layout.addStretch()
-            self.table_view.setCellWidget(row, 6, groups_widget)
-            # Also set an empty item for background handling
-            groups_item = QTableWidgetItem()
-            groups_item.setData(Qt.ItemDataRole.UserRole + 1, account)
-            self.table_view.setItem(row, 6, groups_item)
-
-            # Notes column
-            notes_item = QTableWidgetItem(account.notes or "-")
-            notes_item.setForeground(QColor(t.text_secondary if account.notes else t.text_tertiary))
-            self.table_view.setItem(row, 7, notes_item)
-
-            # Apply row background based on selection state
-            is_row_selected = (row == self.selected_table_row)
-            is_multi_selected = self.multi_select_mode and self.selection_manager.is_selected(account)
-
-            if is_row_selected or is_multi_selected:
-                # Same as card selection: t.bg_hover
-                row_color = QColor(t.bg_hover)
-            else:
-                row_color = QColor(t.bg_primary)
-
-            row_brush = QBrush(row_color)
-            for col in range(8):
-                item = self.table_view.item(row, col)
-                if item:
-                    item.setBackground(row_brush)
-                # Also update cell widget background (for groups column)
-                widget = self.table_view.cellWidget(row, col)
-                if widget:
-                    widget.setAutoFillBackground(True)
-                    pal = widget.palette()
-                    pal.setColor(widget.backgroundRole(), row_color)
-                    widget.setPalette(pal)
+        email_display = account.email if visible else self._mask_email(account.email)
+        pwd_display = account.password if visible else ("••••••••" if account.password else "-")
+        if backup:
+            backup_display = backup if visible else self._mask_email(backup)
+        else:
+            backup_display = "-"
+        if account.secret:
+            secret_display = account.secret[:8] + "..." if visible else "••••••••"
+        else:
+            secret_display = "-"
+        return email_display, pwd_display, backup_display, secret_display
+
+    @staticmethod
+    def _table_code_text(account: Account, code: Optional[str], visible: bool) -> str:
+        """Get the display text of the table code column, full or masked."""
+        if not account.secret:
+            return "-"
+        return f"{code[:3]} {code[3:]}" if code and len(code) == 6 and visible else "*** ***"
+
+    def _update_table_texts(self) -> None:
+        """Re-render table cell texts in place (e.g. after a visibility toggle)."""
+        self.table_model.set_visible(self.codes_visible)
 
     def _handle_table_selection(self, account: Account, row: int) -> None:
         """Unified table selection handler using SelectionManager.
@@ -6036,13 +6213,10 @@ class MainWindowV2(QMainWindow):
 
         # Use SelectionManager with table accounts list
         self.selection_manager.handle_click(account, row, self._table_accounts, shift_held)
-
-        self._refresh_table_view()
-        self._update_batch_bar()
+        self._selection_timer.start()
 
     def _on_table_cell_clicked(self, row: int, column: int) -> None:
         """Handle table cell click - row selection and copy."""
-        t = get_theme()
         zh = self.state.language == 'zh'
 
         # Get account for this row
@@ -6050,8 +6224,9 @@ class MainWindowV2(QMainWindow):
             return
         account = self._table_accounts[row]
 
-        # In multi-select mode, skip column 0 (checkbox column) - handled by checkbox click
+        # In multi-select mode, column 0 is the checkbox
         if self.multi_select_mode and column == 0:
+            self._on_table_checkbox_clicked(account, row)
             return
 
         # In multi-select mode, use unified selection handler
@@ -6059,92 +6234,37 @@ class MainWindowV2(QMainWindow):
             self._handle_table_selection(account, row)
             return
 
-        # Normal mode: Update row selection (highlight entire row in gray)
-        old_selected_row = self.selected_table_row
+        # Normal mode: Update row selection (highlight entire row in gray);
+        # the model repaints only the old and new rows
         self.selected_table_row = row
-
-        # Update old row background to default
-        if old_selected_row >= 0 and old_selected_row != row:
-            default_brush = QBrush(QColor(t.bg_primary))
-            for col in range(8):
-                old_item = self.table_view.item(old_selected_row, col)
-                if old_item:
-                    old_item.setBackground(default_brush)
-                old_widget = self.table_view.cellWidget(old_selected_row, col)
-                if old_widget:
-                    old_widget.setAutoFillBackground(True)
-                    pal = old_widget.palette()
-                    pal.setColor(old_widget.backgroundRole(), QColor(t.bg_primary))
-                    old_widget.setPalette(pal)
-
-        # Update new row background (same as card selection: t.bg_hover)
-        selected_color = QColor(t.bg_hover)
-        selected_brush = QBrush(selected_color)
-        for col in range(8):
-            new_item = self.table_view.item(row, col)
-            if new_item:
-                new_item.setBackground(selected_brush)
-            new_widget = self.table_view.cellWidget(row, col)
-            if new_widget:
-                new_widget.setAutoFillBackground(True)
-                pal = new_widget.palette()
-                pal.setColor(new_widget.backgroundRole(), selected_color)
-                new_widget.setPalette(pal)
+        self.table_model.set_selected_row(row)
 
         # Skip ID/checkbox column for copy
-        if column == 0:
-            self.table_view.repaint()
-            return
-
-        # Handle groups column - no copy, just select row (right-click for edit)
-        if column == 6:
-            self.table_view.repaint()
+        # Groups column - no copy, just select row (right-click for edit)
+        if column == 0 or column == 6:
             return
 
         # Notes column - click to start inline editing
         if column == 7:
-            self.table_view.repaint()
             self._start_table_notes_edit(account, row)
             return
 
-        # For other columns, copy to clipboard
-        item = self.table_view.item(row, column)
-        if not item:
-            return
-
         # Get original (unmasked) value for columns 1-5
-        if column in [1, 2, 3, 4, 5]:
-            text = item.data(Qt.ItemDataRole.UserRole)
-        else:
-            text = item.text()
+        text = self.table_model.index(row, column).data(Qt.ItemDataRole.UserRole)
 
         if text and text != "-":
             # Copy to clipboard
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
 
-            # Visual feedback - use theme-appropriate highlight color
-            is_dark = get_theme_manager().is_dark
-            highlight_color = "#6B5A20" if is_dark else "#FEF9C3"  # Warm amber for dark mode, light yellow for light
-            highlight_brush = QBrush(QColor(highlight_color))
-            item.setBackground(highlight_brush)
-            self.table_view.repaint()
-
-            def restore_bg():
-                # Restore to selected row color (t.bg_hover)
-                item.setBackground(QBrush(QColor(t.bg_hover)))
-                self.table_view.repaint()
-
-            QTimer.singleShot(500, restore_bg)
+            # Visual feedback - theme-appropriate highlight, restored to the row color
+            self.table_model.set_flash_cell(row, column)
+            QTimer.singleShot(500, self.table_model.clear_flash_cell)
 
             # Show toast
-            column_names = ["#", "邮箱" if zh else "Email", "密码" if zh else "Password",
-                          "辅助邮箱" if zh else "Backup", "2FA密钥" if zh else "2FA Key",
-                          "验证码" if zh else "Code", "分组" if zh else "Groups", "备注" if zh else "Notes"]
-            col_name = column_names[column] if column < len(column_names) else ""
-            self.toast.show_message(f"已复制 {col_name}" if zh else f"Copied {col_name}")
-        else:
-            self.table_view.repaint()
+            toasts = TABLE_COPY_TOASTS['zh' if zh else 'en']
+            if 0 <= column < len(toasts):
+                self.toast.show_message(toasts[column])
 
     def _on_table_context_menu(self, pos) -> None:
         """Handle right-click context menu on table."""
@@ -6152,13 +6272,13 @@ class MainWindowV2(QMainWindow):
         zh = self.state.language == 'zh'
         ic = t.text_secondary
 
-        # Get the item at click position
-        item = self.table_view.itemAt(pos)
-        if not item:
+        # Get the cell at click position
+        index = self.table_view.indexAt(pos)
+        if not index.isValid():
             return
 
-        row = item.row()
-        column = self.table_view.columnAt(pos.x())
+        row = index.row()
+        column = index.column()
 
         # Get account for this row
         if not hasattr(self, '_table_accounts') or row >= len(self._table_accounts):
@@ -6216,6 +6336,7 @@ class MainWindowV2(QMainWindow):
         delete_action.triggered.connect(lambda: self._delete_single_account(account))
 
         menu.exec(self.table_view.mapToGlobal(pos))
+        menu.deleteLater()
 
     def _start_table_cell_edit(self, account: Account, row: int, column: int, field_name: str) -> None:
         """Start inline editing for a table cell with expandable width."""
@@ -6359,7 +6480,7 @@ class MainWindowV2(QMainWindow):
         for group in self.state.groups:
             if group.name not in account.groups:
                 action = add_menu.addAction(group.name)
-                action.triggered.connect(lambda checked, g=group.name, a=account: self._table_add_to_group(a, g))
+                action.triggered.connect(partial(self._table_add_to_group, account, group.name))
 
         if not any(g.name not in account.groups for g in self.state.groups):
             no_action = add_menu.addAction("无可用分组" if zh else "No available groups")
@@ -6370,7 +6491,7 @@ class MainWindowV2(QMainWindow):
             remove_menu = menu.addMenu("从分组移除" if zh else "Remove from group")
             for group_name in account.groups:
                 action = remove_menu.addAction(group_name)
-                action.triggered.connect(lambda checked, g=group_name, a=account: self._table_remove_from_group(a, g))
+                action.triggered.connect(partial(self._table_remove_from_group, account, group_name))
 
         menu.addSeparator()
 
@@ -6380,20 +6501,44 @@ class MainWindowV2(QMainWindow):
 
         # Show at click position
         menu.exec(self.table_view.mapToGlobal(pos))
+        menu.deleteLater()
 
     def _table_add_to_group(self, account, group_name: str) -> None:
         """Add account to group from table context menu."""
         if group_name not in account.groups:
             account.groups.append(group_name)
             self._save_data()
-            self._refresh_table_view()
+            self._refresh_table_row(account, group_name)
 
     def _table_remove_from_group(self, account, group_name: str) -> None:
         """Remove account from group from table context menu."""
         if group_name in account.groups:
             account.groups.remove(group_name)
             self._save_data()
+            self._refresh_table_row(account, group_name)
+
+    def _refresh_table_row(self, account: Account, group_name: Optional[str] = None) -> None:
+        """
+        Show an edit to one account in the table.
+
+        Only that row is repainted, unless a search or the edited group
+        filters the list: then the account may have to appear or disappear,
+        and the table is re-filtered.
+
+        Args:
+            account: The edited account.
+            group_name: Group the account was added to or removed from, if any.
+        """
+        if self._table_rows is None:
+            self._table_rows = {id(a): i for i, a in enumerate(self._table_accounts)}
+        row = self._table_rows.get(id(account), -1)
+        filtered = bool(self.search_input.text().strip()) or (
+            group_name is not None and group_name == self.selected_group
+        )
+        if row < 0 or filtered:
             self._refresh_table_view()
+        else:
+            self.table_model.refresh_row(row)
 
     def _start_table_notes_edit(self, account, row: int) -> None:
         """Start inline editing for notes in table view."""
@@ -6422,8 +6567,8 @@ class MainWindowV2(QMainWindow):
         # Connect signals - Enter to save
         edit.returnPressed.connect(self._finish_table_notes_edit)
 
-        # Set as cell widget
-        self.table_view.setCellWidget(row, 7, edit)
+        # Set as index widget over the notes cell
+        self.table_view.setIndexWidget(self.table_model.index(row, 7), edit)
         edit.setFocus()
         edit.selectAll()
 
@@ -6449,16 +6594,16 @@ class MainWindowV2(QMainWindow):
             account.notes = new_notes if new_notes else None
             self._save_data()
 
-        # Remove the cell widget first
-        self.table_view.removeCellWidget(row, 7)
+        # Remove the index widget first (the view deletes it)
+        self.table_view.setIndexWidget(self.table_model.index(row, 7), None)
 
         # Clean up references
         self._table_notes_edit = None
         self._table_notes_account = None
         self._table_notes_row = None
 
-        # Refresh to restore normal cell
-        self._refresh_table_view()
+        # Repaint the notes cell (the rest of the table is unchanged)
+        self._refresh_table_row(account)
 
         # Also update detail panel if this account is selected
         if self.selected_account == account:
@@ -6470,11 +6615,13 @@ class MainWindowV2(QMainWindow):
             return
         self._handle_table_selection(account, row)
 
-    def _mask_email(self, email: str) -> str:
+    @staticmethod
+    def _mask_email(email: str) -> str:
         """Mask email for privacy display."""
-        if not email or '@' not in email:
+        # One partition() scan instead of an '@' test plus split()
+        local, at, domain = email.partition('@')
+        if not at:
             return email[:3] + "***" if email else ""
-        local, domain = email.split('@', 1)
         return f"{local[:3]}***@{domain}"
 
     def _show_settings_menu(self) -> None:
@@ -6545,6 +6692,7 @@ class MainWindowV2(QMainWindow):
 
         menu.aboutToHide.connect(lambda: setattr(self, '_settings_menu', None))
         menu.exec(global_pos)
+        menu.deleteLater()
 
     def _show_import_dialog(self) -> None:
         """Show import dialog for batch importing accounts."""
@@ -6557,10 +6705,24 @@ class MainWindowV2(QMainWindow):
             if accounts:
                 zh = self.state.language == 'zh'
 
-                # Check for duplicates (by email)
-                existing_emails = {a.email.lower() for a in self.state.accounts}
-                duplicates = [a for a in accounts if a.email.lower() in existing_emails]
-                new_accounts = [a for a in accounts if a.email.lower() not in existing_emails]
+                # Check for duplicates (by email) against an index built once;
+                # new emails join the index so repeats within the batch count too
+                existing_by_email: Dict[str, Account] = {}
+                # Bound once: these loops run per existing account and per imported line
+                index_existing = existing_by_email.setdefault
+                for existing in self.state.accounts:
+                    index_existing(existing.email_normalized, existing)
+                duplicates = []
+                new_accounts = []
+                is_known = existing_by_email.__contains__
+                add_duplicate, add_new = duplicates.append, new_accounts.append
+                for account in accounts:
+                    email = account.email_normalized
+                    if is_known(email):
+                        add_duplicate(account)
+                    else:
+                        existing_by_email[email] = account
+                        add_new(account)
 
                 accounts_to_import = []
                 updated_count = 0
@@ -6577,14 +6739,12 @@ class MainWindowV2(QMainWindow):
                     elif action == "update":
                         # Update existing accounts with new data, then add new ones
                         for dup_account in duplicates:
-                            for existing in self.state.accounts:
-                                if existing.email.lower() == dup_account.email.lower():
-                                    # Update existing account with new data
-                                    existing.password = dup_account.password or existing.password
-                                    existing.secret = dup_account.secret or existing.secret
-                                    if hasattr(dup_account, 'backup'):
-                                        existing.backup = dup_account.backup or getattr(existing, 'backup', '')
-                                    break
+                            existing = existing_by_email[dup_account.email_normalized]
+                            # Update existing account with new data
+                            existing.password = dup_account.password or existing.password
+                            existing.secret = dup_account.secret or existing.secret
+                            if hasattr(dup_account, 'backup'):
+                                existing.backup = dup_account.backup or getattr(existing, 'backup', '')
                         accounts_to_import = new_accounts
                         updated_count = len(duplicates)
                     else:  # "all" - import all including duplicates
@@ -6593,11 +6753,11 @@ class MainWindowV2(QMainWindow):
                     accounts_to_import = accounts
 
                 if accounts_to_import:
-                    # Add imported accounts
+                    # Add imported accounts in one batch; the table is rebuilt once below
                     max_id = max((a.id or 0 for a in self.state.accounts), default=0)
-                    for i, account in enumerate(accounts_to_import):
-                        account.id = max_id + i + 1
-                        self.state.accounts.append(account)
+                    for account_id, account in enumerate(accounts_to_import, max_id + 1):
+                        account.id = account_id
+                    self.state.accounts.extend(accounts_to_import)
 
                 self._save_data()
                 self._refresh_groups()
@@ -6819,7 +6979,7 @@ class MainWindowV2(QMainWindow):
             action = menu.addAction(group.name)
             action.setCheckable(True)
             action.setChecked(group.name in self.selected_account.groups)
-            action.toggled.connect(lambda checked, g=group.name: self._toggle_account_tag(g, checked))
+            action.toggled.connect(partial(self._toggle_account_tag, group.name))
 
         if self.state.groups:
             menu.addSeparator()
@@ -6830,6 +6990,7 @@ class MainWindowV2(QMainWindow):
 
         # Show menu at cursor position
         menu.exec(QApplication.instance().activeWindow().cursor().pos())
+        menu.deleteLater()
 
     def _toggle_account_tag(self, group_name: str, checked: bool) -> None:
         """Toggle a tag on the selected account."""
@@ -6922,6 +7083,7 @@ class MainWindowV2(QMainWindow):
         delete_action.triggered.connect(lambda: self._delete_tag(group_name))
 
         menu.exec(btn.mapToGlobal(pos))
+        menu.deleteLater()
 
     def _delete_tag(self, group_name: str) -> None:
         """Delete a tag/group from the system with confirmation and undo."""
@@ -6929,8 +7091,9 @@ class MainWindowV2(QMainWindow):
         t = get_theme()
         is_dark = get_theme_manager().is_dark
 
-        # Count accounts using this group
-        count = sum(1 for acc in self.state.accounts if group_name in acc.groups)
+        # Accounts using this group; counted for the dialog, updated on delete
+        members = [acc for acc in self.state.accounts if group_name in acc.groups]
+        count = len(members)
 
         # Dark mode: use colors matching library panel (softer grays)
         # Light mode: use standard theme colors
@@ -7014,14 +7177,15 @@ class MainWindowV2(QMainWindow):
             return
 
         # Backup for undo
-        deleted_group = next((g for g in self.state.groups if g.name == group_name), None)
-        affected_accounts = [(acc.id, list(acc.groups)) for acc in self.state.accounts if group_name in acc.groups]
-        group_index = next((i for i, g in enumerate(self.state.groups) if g.name == group_name), 0)
+        group_index, deleted_group = next(
+            ((i, g) for i, g in enumerate(self.state.groups) if g.name == group_name), (0, None)
+        )
 
-        # Remove from all accounts
-        for acc in self.state.accounts:
-            if group_name in acc.groups:
-                acc.groups.remove(group_name)
+        # Remove from all accounts, keeping their old groups for undo
+        affected_accounts = []
+        for acc in members:
+            affected_accounts.append((acc.id, list(acc.groups)))
+            acc.groups.remove(group_name)
 
         # Remove from groups list
         self.state.groups = [g for g in self.state.groups if g.name != group_name]
@@ -7036,9 +7200,10 @@ class MainWindowV2(QMainWindow):
             if deleted_group:
                 # Restore group at original position
                 self.state.groups.insert(group_index, deleted_group)
-                # Restore group to affected accounts
+                # Restore group to affected accounts (one id index, not a scan per account)
+                by_id = {a.id: a for a in self.state.accounts}
                 for acc_id, original_groups in affected_accounts:
-                    acc = next((a for a in self.state.accounts if a.id == acc_id), None)
+                    acc = by_id.get(acc_id)
                     if acc:
                         acc.groups = original_groups
                 self._save_data()
@@ -7134,10 +7299,21 @@ class MainWindowV2(QMainWindow):
             self.copied_toast_timer.start(2000)
 
     def _save_data(self) -> None:
-        """Save application data."""
+        """Schedule a save of application data (coalesced, see _flush_save)."""
+        self._save_pending = True
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _flush_save(self) -> None:
+        """Write pending application data to the current library now."""
+        self._save_timer.stop()
+        if not self._save_pending:
+            return
+        self._save_pending = False
         self.state.theme = self.theme_manager.mode.value
         current = self.library_service.get_current_library()
-        self.library_service.save_library_state(current, self.state)
+        # Serialized here, written on the library service's worker thread
+        self.library_service.save_library_state(current, self.state, background=True)
 
     def mousePressEvent(self, event) -> None:
         """Clear focus from inputs when clicking elsewhere."""
@@ -7146,10 +7322,28 @@ class MainWindowV2(QMainWindow):
             focused.clearFocus()
         super().mousePressEvent(event)
 
+    def showEvent(self, event) -> None:
+        """Resume the TOTP countdown when the window is shown."""
+        super().showEvent(event)
+        self._resume_timer()
+
+    def changeEvent(self, event) -> None:
+        """Resume the TOTP countdown when the window is restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._resume_timer()
+
+    def _resume_timer(self) -> None:
+        """Restart the paused TOTP countdown (codes regenerate if the step rolled over)."""
+        if hasattr(self, 'timer') and not self.timer.isActive():
+            self._update_timer()
+
     def closeEvent(self, event) -> None:
         """Handle window close - auto archive and save."""
-        # Save current data
+        # Save current data, and make sure it is on disk before exiting
         self._save_data()
+        self._flush_save()
+        self.library_service.wait_for_writes()
 
         # Create archive
         try:
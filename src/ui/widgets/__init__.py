@@ -3,9 +3,12 @@
 from .toast import ToastNotification
 from .draggable_list import DraggableGroupList
 from .drag_handle import DragHandle
+from .account_table import AccountTableModel, GroupTagDelegate
 
 __all__ = [
     "ToastNotification",
     "DraggableGroupList",
     "DragHandle",
+    "AccountTableModel",
+    "GroupTagDelegate",
 ]
@@ -0,0 +1,444 @@
+"""
+Table model and group-tag delegate for the account list view.
+"""
+
+from typing import Callable, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetrics, QIcon, QPainter
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+from ..theme import get_theme, get_theme_manager
+from ..icons import icon_checkbox, icon_checkbox_empty
+from ...models.account import Account
+
+
+class AccountTableModel(QAbstractTableModel):
+    """
+    Read-only model serving the list view straight from the account list.
+
+    No per-cell objects are kept: the view only asks for the rows it paints,
+    so TOTP codes are only computed for those rows, and a new time step is
+    a single dataChanged() over the code column.
+
+    Columns: 0=#/checkbox, 1=email, 2=password, 3=backup, 4=secret,
+    5=code, 6=groups (painted by GroupTagDelegate), 7=notes.
+    """
+
+    COLUMN_COUNT = 8
+    CODE_COLUMN = 5
+    GROUPS_COLUMN = 6
+    NOTES_COLUMN = 7
+
+    # Role carrying the row's Account (same role the table items used)
+    AccountRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, field_texts: Callable[[Account, bool], tuple],
+                 code_text: Callable[[Account, Optional[str], bool], str],
+                 code: Callable[[str, int], Optional[str]], parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            field_texts: Callback returning the display strings of columns
+                1-4 (email..secret) for an account, full or masked.
+            code_text: Callback returning the code column text for an
+                (account, code) pair, full or masked.
+            code: Callback returning the TOTP code of a secret for a time-step
+                counter, or None if it is invalid. Only called for rows being
+                painted.
+            parent: Parent object (optional).
+        """
+        super().__init__(parent)
+        self._field_text_fn = field_texts
+        self._code_text_fn = code_text
+        self._code_fn = code
+        self._accounts: list[Account] = []
+        self._counter = 0  # TOTP time step the code column shows
+        self._visible = True
+        # Display texts, built lazily per painted row. Field texts are kept
+        # for both full and masked modes, so toggling visibility is a lookup;
+        # code texts are dropped on every new time step.
+        self._field_texts: dict[bool, list[Optional[tuple]]] = {True: [], False: []}
+        self._code_texts: list[Optional[str]] = []
+        self._headers: Sequence[str] = ()
+        self._multi_select = False
+        self._is_checked: Callable[[Account], bool] = lambda account: False
+        self._check_icons: tuple = ()
+        self._selected_row = -1
+        self._flash_cell: Optional[tuple[int, int]] = None
+        self._load_colors()
+
+    def _load_colors(self) -> None:
+        """Resolve the theme colors used by data() once per reset."""
+        t = get_theme()
+        is_dark = get_theme_manager().is_dark
+        self._fg_primary = QColor(t.text_primary)
+        self._fg_secondary = QColor(t.text_secondary)
+        self._fg_tertiary = QColor(t.text_tertiary)
+        self._fg_success = QColor(t.success)
+        self._bg_default = QBrush(QColor(t.bg_primary))
+        self._bg_selected = QBrush(QColor(t.bg_hover))  # Same as card selection
+        # Copy feedback: warm amber for dark mode, light yellow for light
+        self._bg_flash = QBrush(QColor("#6B5A20" if is_dark else "#FEF9C3"))
+
+    # === Population ===
+
+    def set_accounts(self, accounts: list[Account], counter: int,
+                     headers: Sequence[str], visible: bool = True,
+                     selected_row: int = -1, multi_select: bool = False,
+                     is_checked: Optional[Callable[[Account], bool]] = None) -> None:
+        """
+        Replace the rows shown by the view.
+
+        Args:
+            accounts: Accounts to show, one per row.
+            counter: Current TOTP time-step counter.
+            headers: Column titles.
+            visible: Whether sensitive columns show full values (else masked).
+            selected_row: Row highlighted as selected, or -1.
+            multi_select: Whether column 0 shows selection checkboxes.
+            is_checked: Predicate telling whether an account is checked.
+        """
+        self.beginResetModel()
+        self._accounts = accounts
+        self._counter = counter
+        self._visible = visible
+        self._field_texts = {True: [None] * len(accounts), False: [None] * len(accounts)}
+        self._code_texts = [None] * len(accounts)
+        self._headers = headers
+        self._selected_row = selected_row
+        self._multi_select = multi_select
+        if is_checked is not None:
+            self._is_checked = is_checked
+        if multi_select:
+            t = get_theme()
+            self._check_icons = (
+                QIcon(icon_checkbox_empty(14, t.text_tertiary)),
+                QIcon(icon_checkbox(14, t.text_secondary)),
+            )
+        self._flash_cell = None
+        self._load_colors()
+        self.endResetModel()
+
+    def refresh_codes(self, counter: int) -> None:
+        """Repaint the code column for a new time step (painted rows fetch their codes)."""
+        self._counter = counter
+        if not self._accounts:
+            return
+        self._code_texts = [None] * len(self._accounts)
+        self.dataChanged.emit(
+            self.index(0, self.CODE_COLUMN),
+            self.index(len(self._accounts) - 1, self.CODE_COLUMN),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole],
+        )
+
+    def set_visible(self, visible: bool) -> None:
+        """Switch the sensitive columns between full and masked values."""
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if not self._accounts:
+            return
+        self._code_texts = [None] * len(self._accounts)
+        self.dataChanged.emit(
+            self.index(0, 1),
+            self.index(len(self._accounts) - 1, self.CODE_COLUMN),
+            [Qt.ItemDataRole.DisplayRole],
+        )
+
+    def refresh_row(self, row: int) -> None:
+        """Re-read a row after its account was edited, dropping its cached texts."""
+        if not 0 <= row < len(self._accounts):
+            return
+        self._field_texts[True][row] = None
+        self._field_texts[False][row] = None
+        self._code_texts[row] = None
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def remove_row(self, row: int) -> None:
+        """
+        Drop one row in place, keeping the cached texts of the others.
+
+        The row is deleted from the accounts list passed to set_accounts().
+        Rows below it move up, so their "#n" numbers are repainted.
+
+        Args:
+            row: Row to remove.
+        """
+        if not 0 <= row < len(self._accounts):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._accounts[row]
+        del self._field_texts[True][row]
+        del self._field_texts[False][row]
+        del self._code_texts[row]
+        if self._selected_row == row:
+            self._selected_row = -1
+        elif self._selected_row > row:
+            self._selected_row -= 1
+        self._flash_cell = None
+        self.endRemoveRows()
+        if row < len(self._accounts):
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(len(self._accounts) - 1, 0),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+    def refresh_groups(self) -> None:
+        """Repaint the groups column (after a group was renamed)."""
+        if not self._accounts:
+            return
+        self.dataChanged.emit(
+            self.index(0, self.GROUPS_COLUMN),
+            self.index(len(self._accounts) - 1, self.GROUPS_COLUMN),
+            [Qt.ItemDataRole.UserRole],
+        )
+
+    def set_selected_row(self, row: int) -> None:
+        """Highlight a single row, repainting only the old and new rows."""
+        old_row, self._selected_row = self._selected_row, row
+        for changed in {old_row, row}:
+            self._emit_row_changed(changed, Qt.ItemDataRole.BackgroundRole)
+
+    def refresh_checks(self) -> None:
+        """Repaint the multi-select check state of every row (after a selection change)."""
+        if not self._accounts:
+            return
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(len(self._accounts) - 1, self.COLUMN_COUNT - 1),
+            [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.DecorationRole],
+        )
+
+    def set_flash_cell(self, row: int, column: int) -> None:
+        """Flash a cell with the copy highlight color."""
+        self.clear_flash_cell()
+        self._flash_cell = (row, column)
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.BackgroundRole])
+
+    def clear_flash_cell(self) -> None:
+        """Restore the flashed cell (no-op if the rows were replaced meanwhile)."""
+        if self._flash_cell is None:
+            return
+        row, column = self._flash_cell
+        self._flash_cell = None
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.BackgroundRole])
+
+    def _emit_row_changed(self, row: int, role: int) -> None:
+        """Emit dataChanged for every column of a row, if it exists."""
+        if 0 <= row < len(self._accounts):
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1), [role]
+            )
+
+    def account(self, row: int) -> Optional[Account]:
+        """Get the account shown in a row."""
+        if 0 <= row < len(self._accounts):
+            return self._accounts[row]
+        return None
+
+    # === QAbstractTableModel ===
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self._headers)):
+            return self._headers[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        account = self._accounts[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return f"#{row + 1}"
+            if column < self.CODE_COLUMN:
+                return self._row_field_texts(row)[column - 1]
+            if column == self.CODE_COLUMN:
+                return self._row_code_text(row)
+            if column == self.NOTES_COLUMN:
+                return account.notes or "-"
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if self._flash_cell == (row, column):
+                return self._bg_flash
+            if row == self._selected_row or (self._multi_select and self._is_checked(account)):
+                return self._bg_selected
+            return self._bg_default
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 0:
+                return self._fg_tertiary
+            if column == 1:
+                return self._fg_primary
+            if column == self.CODE_COLUMN:
+                return self._fg_success if account.secret else self._fg_tertiary
+            if column == self.NOTES_COLUMN:
+                return self._fg_secondary if account.notes else self._fg_tertiary
+            return self._fg_secondary
+
+        if role == Qt.ItemDataRole.UserRole:
+            # Original (unmasked) values for copying
+            if column == 1:
+                return account.email
+            if column == 2:
+                return account.password
+            if column == 3:
+                return getattr(account, 'backup', '') or getattr(account, 'backup_email', '') or ''
+            if column == 4:
+                return account.secret
+            if column == self.CODE_COLUMN:
+                return self._code_fn(account.secret, self._counter) if account.secret else ""
+            if column == self.GROUPS_COLUMN:
+                return account.groups
+            return None
+
+        if role == self.AccountRole:
+            return account
+
+        if role == Qt.ItemDataRole.DecorationRole:
+            if column == 0 and self._multi_select:
+                return self._check_icons[self._is_checked(account)]
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 0 and not self._multi_select:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+
+        return None
+
+    def _row_field_texts(self, row: int) -> tuple:
+        """Get (and cache) the display texts of columns 1-4 for a row."""
+        cache = self._field_texts[self._visible]
+        texts = cache[row]
+        if texts is None:
+            texts = self._field_text_fn(self._accounts[row], self._visible)
+            cache[row] = texts
+        return texts
+
+    def _row_code_text(self, row: int) -> str:
+        """Get (and cache) the code column text for a row."""
+        text = self._code_texts[row]
+        if text is None:
+            account = self._accounts[row]
+            # A masked code needs no HMAC; offscreen rows are never asked
+            code = self._code_fn(account.secret, self._counter) if self._visible and account.secret else None
+            text = self._code_text_fn(account, code, self._visible)
+            self._code_texts[row] = text
+        return text
+
+
+class GroupTagDelegate(QStyledItemDelegate):
+    """
+    Paints an account's groups as small tags (same style as card view).
+
+    Replaces the per-row QWidget/QLabel cell widgets of the groups column.
+    """
+
+    MAX_TAGS = 5
+    TAG_HEIGHT = 18
+    TAG_PADDING = 6
+    TAG_SPACING = 4
+    MARGIN = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Colors, font and tag widths are built once and reused for every
+        # painted cell, until the theme or the view font changes
+        self._style_key: Optional[tuple] = None
+        self._style: tuple = ()
+        self._tag_widths: dict[str, float] = {}
+
+    def _paint_style(self, view_font: QFont) -> tuple:
+        """Get (tag_bg, tag_fg, muted_fg, font, metrics) for the current theme."""
+        t = get_theme()
+        is_dark = get_theme_manager().is_dark
+        key = (is_dark, t.text_primary, t.text_tertiary, view_font.key())
+        if key != self._style_key:
+            if is_dark:
+                tag_bg = QColor("#9CA3AF")
+                tag_fg = QColor("#111827")
+            else:
+                tag_bg = QColor(120, 120, 128, 41)  # rgba(120, 120, 128, 0.16)
+                tag_fg = QColor(t.text_primary)
+            font = QFont(view_font)
+            font.setPixelSize(10)
+            font.setWeight(QFont.Weight.Medium)
+            self._style = (tag_bg, tag_fg, QColor(t.text_tertiary), font, QFontMetrics(font))
+            self._style_key = key
+            self._tag_widths.clear()
+        return self._style
+
+    def _tag_width(self, group_name: str, metrics: QFontMetrics) -> float:
+        """Get (and cache) the painted width of a group tag."""
+        width = self._tag_widths.get(group_name)
+        if width is None:
+            width = metrics.horizontalAdvance(group_name) + 2 * self.TAG_PADDING
+            self._tag_widths[group_name] = width
+        return width
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        # Default painting draws the row background (the cell has no text)
+        super().paint(painter, option, index)
+
+        groups = index.data(Qt.ItemDataRole.UserRole) or []
+        rect = option.rect
+        tag_bg, tag_fg, muted_fg, font, metrics = self._paint_style(option.font)
+
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if not groups:
+            painter.setPen(muted_fg)
+            painter.drawText(
+                rect.adjusted(self.MARGIN, 0, -self.MARGIN, 0),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "-"
+            )
+            painter.restore()
+            return
+
+        painter.setFont(font)
+
+        x = rect.x() + self.MARGIN
+        y = rect.y() + (rect.height() - self.TAG_HEIGHT) / 2
+        for group_name in groups[:self.MAX_TAGS]:
+            width = self._tag_width(group_name, metrics)
+            tag_rect = QRectF(x, y, width, self.TAG_HEIGHT)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(tag_bg)
+            painter.drawRoundedRect(tag_rect, 3, 3)
+            painter.setPen(tag_fg)
+            painter.drawText(tag_rect, Qt.AlignmentFlag.AlignCenter, group_name)
+            x += width + self.TAG_SPACING
+
+        if len(groups) > self.MAX_TAGS:
+            more = f"+{len(groups) - self.MAX_TAGS}"
+            painter.setPen(muted_fg)
+            painter.drawText(
+                QRectF(x, y, metrics.horizontalAdvance(more) + 2, self.TAG_HEIGHT),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, more
+            )
+
+        painter.restore()
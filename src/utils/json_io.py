@@ -0,0 +1,92 @@
+"""
+JSON file helpers for the data, library and archive files.
+
+Uses orjson when it is installed (much faster for large account files)
+and falls back to the standard library otherwise. Both write UTF-8 with
+2-space indentation, so files stay interchangeable.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+
+    Raises:
+        TypeError: If the data is not JSON serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    Parse JSON from bytes.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+            (orjson's decode error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_atomic(path: Path, raw: bytes) -> None:
+    """
+    Replace a file's content atomically.
+
+    The bytes go to a temporary file in the same directory, which is
+    synced and then renamed over the target, so a crash mid-write never
+    leaves a truncated file behind.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the content is not valid JSON.
+    """
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def save_json(path: Path, data: Any) -> None:
+    """
+    Serialize data and write it atomically to a JSON file.
+
+    Raises:
+        OSError: If the file cannot be written.
+        TypeError: If the data is not JSON serializable.
+    """
+    write_atomic(path, dumps_json(data))
@@ -169,3 +169,43 @@ class TestAccountService:
 
         updated = service.find_by_id(1)
         assert updated.password == "newpassword"
+
+    def test_find_duplicates_returns_existing_index(self, populated_account_service):
+        """Test that duplicates are matched case-insensitively with their index."""
+        service = populated_account_service
+        duplicates = service.find_duplicates([Account(email="USER1@example.com")])
+
+        assert len(duplicates) == 1
+        _, existing, index = duplicates[0]
+        assert existing is service.state.accounts[index]
+        assert existing.email == "user1@example.com"
+
+    def test_find_by_email_after_email_change(self, populated_account_service):
+        """Test that lookups follow an email reassigned after first use."""
+        service = populated_account_service
+        account = service.find_by_email("user1@example.com")
+
+        account.email = "Renamed@Example.com"
+
+        assert service.find_by_email("renamed@example.com") is account
+        assert service.find_by_email("user1@example.com") is None
+        assert service.state.is_duplicate_email(" RENAMED@example.com ") is True
+
+    def test_search_text_tracks_field_changes(self, sample_account):
+        """Test that the cached search text follows edits and keeps fields apart."""
+        assert "work" in sample_account.search_text
+        assert "password123" in sample_account.search_text
+        assert "comp" not in sample_account.search_text  # no match across fields
+
+        sample_account.notes = "VIP Client"
+        sample_account.groups.append("Sales")
+
+        assert "vip client" in sample_account.search_text
+        assert "sales" in sample_account.search_text
+
+        sample_account.notes = None
+        sample_account.password = None
+
+        assert "vip client" not in sample_account.search_text
+        assert "password123" not in sample_account.search_text
+        assert "sales" in sample_account.search_text
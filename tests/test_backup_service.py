@@ -0,0 +1,49 @@
+"""
+Tests for the backup service.
+"""
+
+import pytest
+
+from src.config.settings import Settings
+from src.services import backup_service as backup_module
+from src.services.backup_service import BackupService
+
+
+class TestBackupService:
+    """Tests for BackupService."""
+
+    @pytest.fixture
+    def service(self, tmp_path) -> BackupService:
+        """Create a backup service for a data file in a temp directory."""
+        data_file = tmp_path / "data.json"
+        data_file.write_text('{"accounts": []}', encoding="utf-8")
+        return BackupService(data_file, tmp_path / "backups", max_backups=2)
+
+    def test_unchanged_data_is_not_copied_again(self, service, monkeypatch):
+        """Test that a second backup of identical data reuses the latest one."""
+        first = service.create_backup()
+
+        copies = []
+        monkeypatch.setattr(backup_module.shutil, "copy2", lambda *args: copies.append(args))
+
+        assert service.create_backup() == first
+        assert copies == []
+        assert service.get_backup_count() == 1
+
+    def test_cleanup_keeps_newest_and_removes_digests(self, service):
+        """Test that rotation keeps the newest backups and drops stale digests."""
+        service.backup_dir.mkdir()
+        for stamp in ("20240101_000000", "20240102_000000", "20240103_000000"):
+            backup = service.backup_dir / f"{Settings.BACKUP_PREFIX}{stamp}{Settings.BACKUP_SUFFIX}"
+            backup.write_text("{}", encoding="utf-8")
+            service._digest_path(backup).write_text("digest", encoding="utf-8")
+
+        assert service.cleanup_old_backups() == 1
+
+        remaining = sorted(p.name for p in service.backup_dir.iterdir())
+        assert remaining == [
+            f"{Settings.BACKUP_PREFIX}20240102_000000.json",
+            f"{Settings.BACKUP_PREFIX}20240102_000000.json.sha",
+            f"{Settings.BACKUP_PREFIX}20240103_000000.json",
+            f"{Settings.BACKUP_PREFIX}20240103_000000.json.sha",
+        ]
@@ -153,3 +153,21 @@ class TestDataService:
         assert loaded.next_id == 4
         assert loaded.language == "zh"
         assert loaded.accounts[0].groups == ["work"]
+
+    def test_stdlib_fallback_writes_same_file(self, tmp_path, monkeypatch):
+        """Test that saving without orjson produces an identical, loadable file."""
+        from src.utils import json_io
+
+        state = AppState()
+        state.accounts.append(Account(email="用户@example.com", id=1, groups=["工作"]))
+
+        fast_file = tmp_path / "fast.json"
+        DataService(fast_file).save(state)
+
+        monkeypatch.setattr(json_io, "orjson", None)
+        plain_file = tmp_path / "plain.json"
+        service = DataService(plain_file)
+        service.save(state)
+
+        assert plain_file.read_bytes() == fast_file.read_bytes()
+        assert service.load().accounts[0].email == "用户@example.com"
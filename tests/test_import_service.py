@@ -120,6 +120,11 @@ test3@example.com----pass3----backup3@test.com----SECRET3"""
         assert accounts[1].email == "test2@example.com"
         assert accounts[2].email == "test3@example.com"
 
+    def test_parse_line_import_time(self, import_service):
+        """Test that a given import time is recorded as is."""
+        account = import_service.parse_line("test@example.com----pass", "----", "2024-01-02 03:04")
+        assert account.import_time == "2024-01-02 03:04"
+
     def test_parse_text_with_empty_lines(self, import_service):
         """Test that empty lines are skipped."""
         text = """test1@example.com----pass1
@@ -146,3 +151,48 @@ test2@example.com----pass2
         assert ImportService.validate_email("@nodomain.com") is False
         assert ImportService.validate_email("no@") is False
         assert ImportService.validate_email("") is False
+
+    def test_detect_separator_pipe(self, import_service):
+        """Test that || is preferred over | when lines use double pipes."""
+        lines = [
+            "email1@test.com||pass1||backup@test.com||SECRET1",
+            "email2@test.com||pass2||backup2@test.com||SECRET2",
+        ]
+        assert import_service.detect_separator(lines) == "||"
+        assert import_service.detect_separator(["a@test.com|pass|b@test.com"]) == "|"
+
+    def test_detect_separator_mixed_dashes(self, import_service):
+        """Test that shorter dash separators also match longer dash runs."""
+        lines = [
+            "a@test.com----pass",
+            "b@test.com----pass",
+            "c@test.com---pass",
+            "d@test.com---pass",
+            "e@test.com",
+        ]
+        assert import_service.detect_separator(lines) == "---"
+
+    def test_parse_text_crlf(self, import_service):
+        """Test that Windows line endings are handled."""
+        text = "test1@example.com----pass1\r\ntest2@example.com----pass2\r\n"
+        accounts = import_service.parse_text(text)
+
+        assert [a.password for a in accounts] == ["pass1", "pass2"]
+
+    def test_parse_line_ignores_extra_fields(self, import_service):
+        """Test that fields after the 2FA secret are ignored."""
+        line = "test@example.com----pass----backup@test.com----SECRET----extra----more"
+        account = import_service.parse_line(line, "----")
+
+        assert account.secret == "SECRET"
+
+    def test_parse_file_streams_lines(self, import_service, tmp_path):
+        """Test that a file parses like the same text, with the separator detected past blank lines."""
+        text = "\n\n" + "".join(f"user{i}@example.com|pass{i}\r\n" for i in range(8))
+        path = tmp_path / "accounts.txt"
+        path.write_text(text, encoding="utf-8", newline="")
+
+        accounts = import_service.parse_file(str(path))
+
+        assert [a.password for a in accounts] == [a.password for a in import_service.parse_text(text)]
+        assert [a.password for a in accounts] == [f"pass{i}" for i in range(8)]
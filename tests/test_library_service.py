@@ -0,0 +1,68 @@
+"""
+Tests for the library service.
+"""
+
+import pytest
+
+from src.config.settings import Settings
+from src.models.account import Account
+from src.models.app_state import AppState
+from src.services import library_service as library_module
+from src.services.library_service import LibraryInfo, LibraryService
+
+
+class TestLibraryService:
+    """Tests for LibraryService state persistence."""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch) -> LibraryService:
+        """Create a library service storing its files in a temp directory."""
+        monkeypatch.setattr(Settings, "DATA_DIR", tmp_path)
+        return LibraryService(tmp_path)
+
+    @pytest.fixture
+    def library(self) -> LibraryInfo:
+        """Create a library description."""
+        return LibraryInfo(id="test", name="Test", file="library_test.json")
+
+    def test_save_writes_atomically(self, service, library, tmp_path):
+        """Test that saving replaces the file and leaves no temp files behind."""
+        state = AppState()
+        state.accounts.append(Account(email="user@example.com", id=1))
+
+        service.save_library_state(library, state)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["library_test.json"]
+        assert service.load_library_state(library).accounts[0].email == "user@example.com"
+
+    def test_unchanged_state_is_not_rewritten(self, service, library, monkeypatch):
+        """Test that saving identical content skips the disk write."""
+        state = AppState()
+        state.accounts.append(Account(email="user@example.com", id=1))
+        service.save_library_state(library, state)
+
+        writes = []
+        original_write = library_module.write_atomic
+        monkeypatch.setattr(
+            library_module, "write_atomic",
+            lambda path, raw: (writes.append(path), original_write(path, raw))
+        )
+
+        service.save_library_state(library, state)
+        service.save_library_state(library, service.load_library_state(library))
+        assert writes == []
+
+        state.accounts[0].notes = "changed"
+        service.save_library_state(library, state)
+        assert writes == [library.file_path]
+
+    def test_background_save_writes_snapshot(self, service, library):
+        """Test that a background save writes the state as it was when queued."""
+        state = AppState()
+        state.accounts.append(Account(email="user@example.com", id=1))
+
+        service.save_library_state(library, state, background=True)
+        state.accounts[0].notes = "changed after queueing"
+        service.wait_for_writes()
+
+        assert service.load_library_state(library).accounts[0].notes == ""
@@ -0,0 +1,97 @@
+"""
+Tests for the time service.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.services.time_service import TimeService, parse_http_date
+
+
+class TestTimeService:
+    """Tests for TimeService."""
+
+    @pytest.fixture
+    def fetches(self, monkeypatch) -> list:
+        """Stub the network fetch with a server 12 seconds ahead, recording calls."""
+        calls = []
+
+        def fake_internet_time(service):
+            calls.append(service)
+            return time.time() + 12.0
+
+        monkeypatch.setattr(TimeService, "_get_internet_time", fake_internet_time)
+        return calls
+
+    def test_fresh_cache_skips_fetch(self, tmp_path, fetches):
+        """Test that a fresh cached offset is used without a network fetch."""
+        cache_file = tmp_path / "time_offset.json"
+        cache_file.write_text(json.dumps({"offset": 3.5, "fetched_at": time.time() - 60}))
+
+        service = TimeService(cache_file)
+
+        assert service.time_offset == 3.5
+        assert service._sync_thread is None
+        assert fetches == []
+
+    def test_stale_cache_fetches_in_background(self, tmp_path, fetches):
+        """Test that a stale cache is re-fetched off-thread and re-cached."""
+        cache_file = tmp_path / "time_offset.json"
+        cache_file.write_text(json.dumps({"offset": 3.5, "fetched_at": time.time() - 7200}))
+
+        service = TimeService(cache_file)
+        service._sync_thread.join(timeout=5)
+
+        assert len(fetches) == 1
+        assert service.time_offset == pytest.approx(12.0, abs=1.0)
+        assert json.loads(cache_file.read_text())["offset"] == pytest.approx(12.0, abs=1.0)
+
+    def test_failed_fetch_is_not_retried_every_call(self, tmp_path, monkeypatch):
+        """Test that an offline clock falls back to local time without re-fetching."""
+        calls = []
+        monkeypatch.setattr(TimeService, "_get_internet_time", lambda service: calls.append(1))
+
+        service = TimeService(tmp_path / "missing.json")
+        service._sync_thread.join(timeout=5)
+        for _ in range(3):
+            service.get_accurate_time()
+
+        assert service.time_offset == 0.0
+        assert len(calls) == 1
+
+    def test_internet_time_uses_head_request(self, tmp_path, monkeypatch):
+        """Test that the server time is read from a HEAD response's Date header."""
+        requests = []
+
+        class FakeResponse:
+            headers = {"Date": "Tue, 15 Nov 1994 08:12:31 GMT"}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def fake_urlopen(request, timeout):
+            requests.append(request)
+            return FakeResponse()
+
+        cache_file = tmp_path / "time_offset.json"
+        cache_file.write_text(json.dumps({"offset": 0.0, "fetched_at": time.time()}))
+        service = TimeService(cache_file)
+        monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+        assert service._get_internet_time() == 784887151.0
+        assert requests[0].get_method() == "HEAD"
+
+    def test_parse_http_date(self):
+        """Test parsing RFC 1123 dates and rejecting other formats."""
+        assert parse_http_date("Sun, 06 Nov 1994 08:49:37 GMT") == 784111777.0
+        assert parse_http_date("Sat, 29 Feb 2020 23:59:59 GMT") == 1583020799.0
+
+        for bad in ("", "Sunday, 06-Nov-94 08:49:37 GMT", "Sun, 06 Nov 1994 08:49:37 +0100",
+                    "Sun, 06 Foo 1994 08:49:37 GMT"):
+            with pytest.raises(ValueError):
+                parse_http_date(bad)
@@ -102,3 +102,82 @@ class TestTotpService:
         """Test that verify_code handles empty inputs."""
         assert totp_service.verify_code("", "123456") is False
         assert totp_service.verify_code("JBSWY3DPEHPK3PXP", "") is False
+
+    def test_decoded_key_is_cached_per_secret(self, totp_service):
+        """Test that the secret is base32-decoded once and reused."""
+        secret = "JBSW Y3DP EHPK 3PXP"
+        totp_service.generate_code(secret)
+        key = totp_service._key_cache[secret]
+
+        totp_service.generate_code(secret)
+        assert totp_service._key_cache[secret] is key
+        assert key == b"Hello!\xde\xad\xbe\xef"
+
+    def test_hotp_rfc4226_vectors(self, totp_service):
+        """Test HOTP output against the RFC 4226 appendix D test values."""
+        key = b"12345678901234567890"
+        expected = ["755224", "287082", "359152", "969429", "338314"]
+
+        assert [TotpService._hotp(key, c) for c in range(5)] == expected
+
+    def test_generate_codes_batch(self, totp_service):
+        """Test that generate_codes maps each secret to its code."""
+        codes = totp_service.generate_codes(["JBSWY3DPEHPK3PXP", "invalid!", ""])
+
+        assert set(codes) == {"JBSWY3DPEHPK3PXP", "invalid!"}
+        assert codes["invalid!"] is None
+        assert totp_service.verify_code("JBSWY3DPEHPK3PXP", codes["JBSWY3DPEHPK3PXP"]) is True
+
+    def test_codes_are_cached_per_time_step(self, totp_service, monkeypatch):
+        """Test that a code is computed once per time step and dropped after it."""
+        secret = "JBSWY3DPEHPK3PXP"
+        key = TotpService._decode_secret(secret)
+        counter = [1000]
+        monkeypatch.setattr(totp_service, "get_counter", lambda: counter[0])
+
+        calls = []
+        original_hotp = TotpService._hotp
+        monkeypatch.setattr(
+            TotpService, "_hotp",
+            staticmethod(lambda k, c, *args: (calls.append(c), original_hotp(k, c, *args))[1])
+        )
+
+        first = totp_service.generate_code(secret)
+        assert totp_service.generate_codes([secret]) == {secret: first}
+        assert totp_service.verify_code(secret, first) is True
+        assert calls == [1000]
+
+        counter[0] = 1001
+        assert totp_service.generate_code(secret) == original_hotp(key, 1001)
+        assert calls == [1000, 1001]
+        assert totp_service._code_cache == {secret: original_hotp(key, 1001)}
+
+    def test_code_at_uses_given_counter(self, totp_service, monkeypatch):
+        """Test that code_at looks a code up without reading the clock."""
+        secret = "JBSWY3DPEHPK3PXP"
+        counter = totp_service.get_counter()
+        expected = totp_service.generate_codes([secret])[secret]
+        monkeypatch.setattr(totp_service, "get_counter", lambda: pytest.fail("clock read"))
+
+        assert totp_service.code_at(secret, counter) == expected
+        assert totp_service.code_at(secret, counter + 1) == TotpService._hotp(
+            TotpService._decode_secret(secret), counter + 1
+        )
+        assert totp_service.code_at("invalid!", counter) is None
+        assert totp_service.code_at("", counter) is None
+
+    def test_invalid_secret_is_decoded_once(self, totp_service, monkeypatch):
+        """Test that a secret failing to decode is remembered as invalid."""
+        calls = []
+        original_decode = TotpService._decode_secret
+        monkeypatch.setattr(
+            TotpService, "_decode_secret",
+            staticmethod(lambda s: (calls.append(s), original_decode(s))[1])
+        )
+
+        for _ in range(3):
+            assert totp_service.generate_codes(["invalid!"]) == {"invalid!": None}
+        with pytest.raises(InvalidSecretError):
+            totp_service.generate_code("invalid!")
+
+        assert calls == ["invalid!"]